@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_clientprofile_providerprofile'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['-created_at'], name='user_created_at_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_user_user_created_at_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='clientprofile',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, help_text='Data e hora em que o registro foi deletado. NULL significa que está ativo.', null=True, verbose_name='Data de Exclusão'),
+        ),
+        migrations.AlterField(
+            model_name='providerprofile',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, help_text='Data e hora em que o registro foi deletado. NULL significa que está ativo.', null=True, verbose_name='Data de Exclusão'),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, help_text='Data e hora em que o registro foi deletado. NULL significa que está ativo.', null=True, verbose_name='Data de Exclusão'),
+        ),
+    ]
@@ -182,6 +182,7 @@ class User(SoftDeleteMixin, AbstractUser):
             models.Index(fields=['email'], name='user_email_idx'),
             models.Index(fields=['user_type'], name='user_type_idx'),
             models.Index(fields=['deleted_at'], name='user_deleted_at_idx'),
+            models.Index(fields=['-created_at'], name='user_created_at_idx'),
         ]
 
     def __str__(self):
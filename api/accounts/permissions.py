@@ -8,6 +8,36 @@ from rest_framework import permissions
 from api.accounts.enums import UserType
 
 
+def _is_admin_request(request):
+    """
+    Verifica se o usuário da requisição é administrador, memoizando o resultado.
+    
+    Uma mesma requisição pode checar IsAdmin várias vezes (has_permission,
+    has_object_permission, IsOwnerOrAdmin); o resultado fica guardado na
+    própria requisição, associado ao usuário avaliado.
+    
+    Args:
+        request: Objeto de requisição
+        
+    Returns:
+        bool: True se o usuário é admin (user_type ADMIN, is_staff ou is_superuser)
+    """
+    user = request.user
+    cached = getattr(request, '_is_admin_cache', None)
+    if cached is not None and cached[0] is user:
+        return cached[1]
+
+    result = bool(
+        user and user.is_authenticated and (
+            user.user_type == UserType.ADMIN.value or  # type: ignore
+            user.is_staff or  # type: ignore
+            user.is_superuser  # type: ignore
+        )
+    )
+    request._is_admin_cache = (user, result)
+    return result
+
+
 class IsClient(permissions.BasePermission):
     """
     Permissão que verifica se o usuário é um cliente.
@@ -78,15 +108,7 @@ class IsAdmin(permissions.BasePermission):
         Returns:
             bool: True se o usuário é admin, False caso contrário
         """
-        if not request.user or not request.user.is_authenticated:
-            return False
-
-        # Verifica se é admin pelo tipo de usuário ou pelo flag is_staff/is_superuser
-        return (
-            request.user.user_type == UserType.ADMIN.value or  # type: ignore
-            request.user.is_staff or  # type: ignore
-            request.user.is_superuser  # type: ignore
-        )
+        return _is_admin_request(request)
 
 
 class IsClientOrProvider(permissions.BasePermission):
@@ -145,8 +167,7 @@ class IsOwnerOrAdmin(permissions.BasePermission):
             return False
 
         # Verifica se é admin
-        if (request.user.user_type == UserType.ADMIN.value or  # type: ignore
-                request.user.is_staff or request.user.is_superuser):  # type: ignore
+        if _is_admin_request(request):
             return True
 
         # Se o objeto é o próprio usuário (para UserViewSet)
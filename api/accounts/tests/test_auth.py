@@ -19,6 +19,7 @@ from django.conf import settings
 
 from api.accounts.models import User, ClientProfile
 from api.accounts.enums import UserType
+from config.settings.base import PASSWORD_HASHERS
 
 
 # =============================================================================
@@ -26,6 +27,7 @@ from api.accounts.enums import UserType
 # =============================================================================
 
 
+@override_settings(PASSWORD_HASHERS=PASSWORD_HASHERS)
 class PasswordHashingTestCase(TestCase):
     """Testes para verificar que o hash de senhas está funcionando corretamente."""
 
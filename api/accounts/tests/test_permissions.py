@@ -219,6 +219,19 @@ class IsAdminPermissionTestCase(TestCase):
         
         self.assertFalse(permission.has_permission(request, MockView()))
 
+    def test_result_is_memoized_per_request(self):
+        """Testa que o resultado é reaproveitado na mesma requisição e refeito ao trocar o usuário."""
+        permission = IsAdmin()
+        request = MockRequest(user=self.admin_user)
+        self.assertTrue(permission.has_permission(request, MockView()))
+
+        # Mudança no mesmo objeto de usuário não é reavaliada na mesma requisição
+        self.admin_user.user_type = UserType.CLIENT.value
+        self.assertTrue(permission.has_permission(request, MockView()))
+
+        request.user = self.client_user
+        self.assertFalse(permission.has_permission(request, MockView()))
+
 
 class IsClientOrProviderPermissionTestCase(TestCase):
     """Testes para a permissão IsClientOrProvider."""
@@ -5,3 +5,7 @@ class AdminConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api.admin'
     label = 'api_admin'  # Label customizado para evitar conflito com django.contrib.admin
+
+    def ready(self):
+        from api.admin.signals import connect_admin_list_cache_signals
+        connect_admin_list_cache_signals()
@@ -0,0 +1,77 @@
+"""
+Cache entre requisições para as listagens administrativas.
+
+As listagens do admin são lidas com muito mais frequência do que mudam
+(administradores recarregam a mesma página com os mesmos filtros), então a
+resposta de `list()` é guardada por um TTL curto.
+
+A invalidação usa uma "versão" por namespace (nome do ViewSet) que faz parte
+da chave: ao salvar/remover um modelo relevante a versão muda (após o commit,
+ver `api.admin.signals`) e as entradas antigas deixam de ser encontradas,
+expirando sozinhas pelo TTL. Isso funciona com qualquer backend de cache, sem
+depender de `delete_pattern`.
+"""
+import hashlib
+import time
+
+from django.core.cache import cache
+from rest_framework.response import Response
+
+ADMIN_LIST_CACHE_TIMEOUT = 60  # segundos
+ADMIN_LIST_CACHE_PREFIX = 'adminlist'
+
+
+def _version_key(namespace: str) -> str:
+    return f'{ADMIN_LIST_CACHE_PREFIX}:{namespace}:version'
+
+
+def get_list_cache_version(namespace: str) -> int:
+    """Retorna a versão atual do namespace, criando-a se necessário."""
+    return cache.get_or_set(_version_key(namespace), time.time_ns, None)
+
+
+def invalidate_admin_list_cache(namespace: str) -> None:
+    """Invalida todas as listagens em cache de um namespace."""
+    cache.set(_version_key(namespace), time.time_ns(), None)
+
+
+def get_list_cache_key(namespace: str, query_params) -> str:
+    """
+    Monta a chave de cache para uma listagem.
+
+    Os query params (filtros e cursor de paginação) são ordenados e
+    resumidos em um hash estável entre processos.
+    """
+    params = '&'.join(
+        f'{name}={value}'
+        for name, values in sorted(query_params.lists())
+        for value in sorted(values)
+    )
+    digest = hashlib.md5(params.encode(), usedforsecurity=False).hexdigest()
+    version = get_list_cache_version(namespace)
+    return f'{ADMIN_LIST_CACHE_PREFIX}:{namespace}:{version}:{digest}'
+
+
+class CachedListMixin:
+    """
+    Mixin para ViewSets que guarda em cache a resposta de `list()`.
+
+    `retrieve` e as actions não são afetados. O namespace é o nome da classe
+    do ViewSet; as dependências de invalidação ficam em `api.admin.signals`.
+    """
+    list_cache_timeout = ADMIN_LIST_CACHE_TIMEOUT
+
+    @classmethod
+    def get_list_cache_namespace(cls) -> str:
+        return cls.__name__
+
+    def list(self, request, *args, **kwargs):
+        key = get_list_cache_key(self.get_list_cache_namespace(), request.query_params)
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+
+        response = super().list(request, *args, **kwargs)  # type: ignore[misc]
+        if response.status_code == 200:
+            cache.set(key, response.data, self.list_cache_timeout)
+        return response
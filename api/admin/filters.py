@@ -0,0 +1,73 @@
+"""
+FilterSets para os ViewSets do app admin.
+
+Centraliza os filtros por query params das listagens administrativas,
+substituindo o parsing manual de `request.query_params` em cada `list()`.
+Os nomes dos parâmetros são mantidos para compatibilidade com os clientes.
+
+Cada parâmetro é validado e convertido uma única vez pelo form do FilterSet,
+de modo que o ORM recebe valores já tipados (bool, int) e valores inválidos
+retornam 400 em vez de chegarem ao banco.
+"""
+from django import forms
+from django_filters import rest_framework as filters
+
+from api.accounts.enums import UserType
+from api.accounts.models import User
+from api.payments.models import Payment
+from api.reviews.models import Review
+from api.subscriptions.enums import PaymentStatus, SubscriptionStatus
+from api.subscriptions.models import UserSubscription
+
+
+class IntegerFilter(filters.Filter):
+    """
+    Filtro numérico validado como `int`.
+
+    O `NumberFilter` padrão usa `DecimalField`; para colunas inteiras (notas,
+    chaves estrangeiras) validamos direto como inteiro, aceitando limites via
+    `min_value`/`max_value`.
+    """
+    field_class = forms.IntegerField
+
+
+class AdminPaymentFilter(filters.FilterSet):
+    """Filtros da listagem de pagamentos (`?status=`)."""
+    status = filters.ChoiceFilter(field_name='payment_status', choices=PaymentStatus.choices())
+
+    class Meta:
+        model = Payment
+        fields = ['status']
+
+
+class AdminReviewFilter(filters.FilterSet):
+    """Filtros da listagem de avaliações (`?rating=&reviewer=&reviewed_user=&order=`)."""
+    rating = IntegerFilter(field_name='rating', min_value=1, max_value=5)
+    reviewer = IntegerFilter(field_name='reviewer_id', min_value=1)
+    reviewed_user = IntegerFilter(field_name='reviewed_user_id', min_value=1)
+    order = IntegerFilter(field_name='order_id', min_value=1)
+
+    class Meta:
+        model = Review
+        fields = ['rating', 'reviewer', 'reviewed_user', 'order']
+
+
+class AdminSubscriptionFilter(filters.FilterSet):
+    """Filtros da listagem de assinaturas (`?status=&plan=&user=`)."""
+    status = filters.ChoiceFilter(field_name='status', choices=SubscriptionStatus.choices())
+    plan = IntegerFilter(field_name='plan_id', min_value=1)
+    user = IntegerFilter(field_name='user_id', min_value=1)
+
+    class Meta:
+        model = UserSubscription
+        fields = ['status', 'plan', 'user']
+
+
+class AdminUserFilter(filters.FilterSet):
+    """Filtros da listagem de usuários (`?user_type=&is_active=`)."""
+    user_type = filters.ChoiceFilter(field_name='user_type', choices=UserType.choices())
+    is_active = filters.BooleanFilter(field_name='is_active')
+
+    class Meta:
+        model = User
+        fields = ['user_type', 'is_active']
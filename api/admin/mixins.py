@@ -0,0 +1,61 @@
+"""
+Mixins para os ViewSets do app admin.
+"""
+from datetime import datetime
+from decimal import Decimal
+
+from rest_framework import serializers
+from rest_framework.response import Response
+
+from api.admin.pagination import UNPAGINATED_CHUNK_SIZE
+
+# Instância única usada só para formatar datas como o ModelSerializer faria
+# (timezone local + formato ISO configurado no DRF).
+_datetime_field = serializers.DateTimeField()
+
+
+def _to_representation(value):
+    """Converte um valor vindo de `.values()` para o mesmo formato do serializer."""
+    if isinstance(value, datetime):
+        return _datetime_field.to_representation(value)
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+class ValuesListMixin:
+    """
+    Mixin que monta a resposta de `list()` direto de `QuerySet.values()`.
+
+    Para listagens somente leitura o custo do ModelSerializer (instanciar
+    modelos, campos e `to_representation` por linha) não se paga: os dados
+    saem do cursor como dicionários e apenas datas e decimais são formatados.
+    `retrieve` e as demais ações continuam usando o serializer.
+
+    Atributos:
+        list_fields: campos na ordem em que aparecem na resposta (a mesma
+            do serializer). FKs são retornadas como ID, igual ao serializer.
+        list_expressions: expressões para campos calculados (ex.: e-mails de
+            relacionamentos, propriedades do modelo), indexadas pelo nome.
+    """
+    list_fields: tuple[str, ...] = ()
+    list_expressions: dict = {}
+
+    def get_list_rows(self, queryset):
+        """Projeta o queryset já filtrado nas colunas da listagem."""
+        plain_fields = [name for name in self.list_fields if name not in self.list_expressions]
+        return queryset.values(*plain_fields, **self.list_expressions)
+
+    def rows_to_representation(self, rows):
+        """Formata as linhas mantendo a ordem de `list_fields`."""
+        fields = self.list_fields
+        return [{name: _to_representation(row[name]) for name in fields} for row in rows]
+
+    def list(self, request, *args, **kwargs):
+        rows = self.get_list_rows(self.filter_queryset(self.get_queryset()))  # type: ignore[attr-defined]
+
+        page = self.paginate_queryset(rows)  # type: ignore[attr-defined]
+        if page is not None:
+            return self.get_paginated_response(self.rows_to_representation(page))  # type: ignore[attr-defined]
+
+        return Response(self.rows_to_representation(rows.iterator(chunk_size=UNPAGINATED_CHUNK_SIZE)))
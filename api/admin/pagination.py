@@ -0,0 +1,23 @@
+"""
+Classes de paginação para os ViewSets do app admin.
+"""
+from rest_framework.pagination import CursorPagination
+
+# Tamanho dos lotes lidos do cursor do banco quando uma listagem não é
+# paginada (ex.: pagination_class = None): evita materializar a tabela
+# inteira como instâncias de modelo de uma só vez.
+UNPAGINATED_CHUNK_SIZE = 500
+
+
+class AdminCursorPagination(CursorPagination):
+    """
+    Paginação por cursor (keyset) para as listagens administrativas.
+
+    Ao contrário de LIMIT/OFFSET, o custo de cada página é proporcional ao
+    tamanho da página e não à sua profundidade, pois o cursor vira um filtro
+    `created_at < X` atendido pelo índice em `created_at`.
+
+    Requer que o modelo listado tenha o campo `created_at` indexado.
+    """
+    ordering = '-created_at'
+    page_size = 50
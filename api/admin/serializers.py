@@ -1,8 +1,16 @@
 """
-Serializers para o app admin (dashboard, estatísticas e relatórios).
+Serializers para o app admin (dashboard, estatísticas, relatórios e
+gerenciamento dos modelos pelos ViewSets administrativos).
 """
 from rest_framework import serializers
 
+from api.accounts.models import User
+from api.admin.models import AdminAction
+from api.orders.models import Order, Proposal
+from api.payments.models import Payment
+from api.reviews.models import Review
+from api.subscriptions.models import UserSubscription
+
 
 class UserStatsSerializer(serializers.Serializer):
     """
@@ -323,3 +331,122 @@ class PerformanceReportSerializer(serializers.Serializer):
         allow_null=True,
         help_text='Avaliação média no período'
     )
+
+
+# ==================== MODELOS (VIEWSETS ADMINISTRATIVOS) ====================
+
+
+class AdminUserSerializer(serializers.ModelSerializer):
+    """Serializer de usuários para o AdminUserViewSet."""
+    # Anotados no queryset do ViewSet
+    subscription_count = serializers.IntegerField(read_only=True)
+    review_count = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = User
+        fields = [
+            'id', 'email', 'first_name', 'last_name', 'phone',
+            'user_type', 'is_active', 'is_staff', 'is_superuser',
+            'date_joined', 'last_login', 'created_at', 'updated_at',
+            'subscription_count', 'review_count'
+        ]
+        read_only_fields = ['id', 'date_joined', 'last_login', 'created_at', 'updated_at']
+
+
+class AdminOrderSerializer(serializers.ModelSerializer):
+    """Serializer de pedidos para o AdminOrderViewSet."""
+
+    class Meta:
+        model = Order
+        fields = [
+            'id', 'client', 'service', 'title', 'description',
+            'budget_min', 'budget_max', 'deadline', 'status',
+            'created_at', 'updated_at'
+        ]
+        read_only_fields = ['id', 'created_at', 'updated_at']
+
+
+class AdminProposalSerializer(serializers.ModelSerializer):
+    """Serializer de propostas para o AdminProposalViewSet."""
+
+    class Meta:
+        model = Proposal
+        fields = [
+            'id', 'order', 'provider', 'message', 'price',
+            'estimated_days', 'status', 'created_at', 'updated_at',
+            'expires_at'
+        ]
+        read_only_fields = ['id', 'created_at', 'updated_at']
+
+
+class AdminPaymentSerializer(serializers.ModelSerializer):
+    """Serializer de pagamentos para o AdminPaymentViewSet."""
+
+    class Meta:
+        model = Payment
+        fields = [
+            'id', 'order', 'proposal', 'amount', 'payment_method',
+            'payment_status', 'transaction_id', 'payment_date',
+            'metadata', 'created_at', 'updated_at'
+        ]
+        read_only_fields = ['id', 'created_at', 'updated_at']
+
+
+class AdminSubscriptionSerializer(serializers.ModelSerializer):
+    """Serializer de assinaturas para o AdminSubscriptionViewSet."""
+    # FKs não nulas (e carregadas via select_related): sem guarda para None
+    user_email = serializers.EmailField(source='user.email', read_only=True)
+    plan_name = serializers.CharField(source='plan.name', read_only=True)
+
+    class Meta:
+        model = UserSubscription
+        fields = [
+            'id', 'user', 'user_email', 'plan', 'plan_name', 'status',
+            'start_date', 'end_date', 'auto_renew', 'cancelled_at',
+            'is_active', 'is_expired', 'created_at', 'updated_at'
+        ]
+        read_only_fields = [
+            'id', 'user_email', 'plan_name', 'is_active', 'is_expired',
+            'created_at', 'updated_at'
+        ]
+
+
+class AdminReviewSerializer(serializers.ModelSerializer):
+    """Serializer de avaliações para o AdminReviewViewSet (moderação)."""
+    # FKs não nulas (e carregadas via select_related): sem guarda para None
+    reviewer_email = serializers.EmailField(source='reviewer.email', read_only=True)
+    reviewed_user_email = serializers.EmailField(source='reviewed_user.email', read_only=True)
+    order_title = serializers.CharField(source='order.title', read_only=True)
+
+    class Meta:
+        model = Review
+        fields = [
+            'id', 'order', 'order_title', 'reviewer', 'reviewer_email',
+            'reviewed_user', 'reviewed_user_email', 'rating', 'comment',
+            'created_at', 'updated_at'
+        ]
+        # Na moderação apenas `rating` e `comment` são editáveis
+        read_only_fields = [
+            'id', 'order', 'order_title', 'reviewer', 'reviewer_email',
+            'reviewed_user', 'reviewed_user_email', 'created_at', 'updated_at'
+        ]
+
+
+class AdminAuditLogSerializer(serializers.ModelSerializer):
+    """Serializer de logs de auditoria para o AdminAuditLogViewSet."""
+    admin_email = serializers.SerializerMethodField()
+
+    class Meta:
+        model = AdminAction
+        fields = [
+            'id', 'admin_user', 'admin_email', 'action_type',
+            'target_model', 'target_id', 'description', 'metadata',
+            'ip_address', 'created_at'
+        ]
+        read_only_fields = [
+            'id', 'admin_user', 'action_type', 'target_model',
+            'target_id', 'description', 'metadata', 'ip_address', 'created_at'
+        ]
+
+    def get_admin_email(self, obj):
+        return obj.admin_user.email if obj.admin_user else None
@@ -0,0 +1,68 @@
+"""
+Signals do app admin.
+
+Invalida o cache das listagens administrativas (ver `api.admin.cache`)
+quando os modelos exibidos nelas são salvos ou removidos.
+
+A troca de versão é registrada com `transaction.on_commit`: dentro de uma
+transação, uma listagem concorrente ainda lê as linhas antigas, e gravá-las
+sob a versão nova as serviria até o TTL. Uma transação desfeita não invalida.
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from api.accounts.models import User
+from api.admin.cache import invalidate_admin_list_cache
+from api.orders.models import Order
+from api.payments.models import Payment
+from api.reviews.models import Review
+from api.subscriptions.models import SubscriptionPlan, UserSubscription
+
+# Namespace (ViewSet) -> modelos cujos dados aparecem na listagem
+ADMIN_LIST_CACHE_DEPENDENCIES = {
+    'AdminPaymentViewSet': [Payment],
+    'AdminReviewViewSet': [Review, Order, User],
+    'AdminSubscriptionViewSet': [UserSubscription, SubscriptionPlan, User],
+    'AdminUserViewSet': [User, UserSubscription, Review],  # contagens anotadas
+}
+
+
+def _namespaces_by_model():
+    namespaces_by_model = {}
+    for namespace, models in ADMIN_LIST_CACHE_DEPENDENCIES.items():
+        for model in models:
+            namespaces_by_model.setdefault(model, []).append(namespace)
+    return namespaces_by_model
+
+
+def invalidate_admin_lists_for_model(model):
+    """
+    Invalida as listagens que exibem dados de `model`.
+    
+    Usado por escritas que não disparam signals (QuerySet.update()).
+    """
+    _invalidate_on_commit(_namespaces_by_model().get(model, []))
+
+
+def _invalidate_on_commit(namespaces):
+    """Invalida os namespaces após o commit da transação atual."""
+    def invalidate():
+        for namespace in namespaces:
+            invalidate_admin_list_cache(namespace)
+    if namespaces:
+        transaction.on_commit(invalidate)
+
+
+def _make_invalidator(namespaces):
+    def invalidate(sender, **kwargs):
+        _invalidate_on_commit(namespaces)
+    return invalidate
+
+
+def connect_admin_list_cache_signals():
+    """Conecta post_save/post_delete de cada modelo aos namespaces que dependem dele."""
+    for model, namespaces in _namespaces_by_model().items():
+        handler = _make_invalidator(namespaces)
+        uid = f'admin_list_cache_{model._meta.label_lower}'
+        post_save.connect(handler, sender=model, weak=False, dispatch_uid=uid)
+        post_delete.connect(handler, sender=model, weak=False, dispatch_uid=uid)
@@ -5,7 +5,10 @@ Inclui testes unitários para serializers e testes de integração para ViewSets
 permissões e middleware de auditoria.
 """
 import uuid
+from unittest import mock
 from decimal import Decimal
+from django.core.cache import cache
+from django.db import transaction
 from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.utils import timezone
@@ -24,6 +27,7 @@ from api.reviews.models import Review
 from api.services.models import Service, ServiceCategory
 from api.admin.models import AdminAction
 from api.admin.permissions import IsAdmin
+from api.admin.views import AdminUserViewSet
 from api.admin.serializers import (
     UserStatsSerializer,
     OrderStatsSerializer,
@@ -407,6 +411,7 @@ class AdminUserViewSetTest(APITestCase, AdminTestMixin):
     """Testes de integração para AdminUserViewSet."""
     
     def setUp(self):
+        cache.clear()
         self.admin_user = self.create_admin_user()
         self.target_user = self.create_client_user()
         self.client.force_authenticate(user=self.admin_user)
@@ -415,7 +420,17 @@ class AdminUserViewSetTest(APITestCase, AdminTestMixin):
         """Deve listar todos os usuários."""
         response = self.client.get('/api/admin/users/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-    
+
+    def test_list_users_uses_cursor_pagination(self):
+        """Deve paginar por cursor, do mais recente para o mais antigo."""
+        response = self.client.get('/api/admin/users/')
+        data = response.json()
+
+        self.assertIn('next', data)
+        self.assertIn('previous', data)
+        self.assertNotIn('count', data)
+        self.assertEqual(data['results'][0]['id'], self.target_user.id)
+
     def test_retrieve_user(self):
         """Deve retornar detalhes de um usuário."""
         response = self.client.get(f'/api/admin/users/{self.target_user.id}/')
@@ -449,6 +464,18 @@ class AdminUserViewSetTest(APITestCase, AdminTestMixin):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.target_user.refresh_from_db()
         self.assertTrue(self.target_user.is_active)
+
+    def test_suspend_nonexistent_user_returns_404(self):
+        """Deve retornar 404 ao suspender usuário inexistente."""
+        response = self.client.post('/api/admin/users/999999/suspend/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_suspend_user_does_not_load_instance(self):
+        """Suspender não deve carregar a linha completa do usuário."""
+        # UPDATE + SELECT do e-mail + INSERT do log de auditoria
+        with self.assertNumQueries(3):
+            response = self.client.post(f'/api/admin/users/{self.target_user.id}/suspend/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
     
     def test_filter_by_user_type(self):
         """Deve filtrar usuários por tipo."""
@@ -461,6 +488,22 @@ class AdminUserViewSetTest(APITestCase, AdminTestMixin):
         for user in response.json().get('results', response.json()):
             self.assertEqual(user['user_type'], UserType.PROVIDER.value)
 
+    def test_filter_by_is_active(self):
+        """Deve filtrar usuários por status ativo."""
+        self.target_user.is_active = False
+        self.target_user.save()
+
+        response = self.client.get('/api/admin/users/', {'is_active': 'false'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        ids = [user['id'] for user in response.json().get('results', response.json())]
+        self.assertEqual(ids, [self.target_user.id])
+
+    def test_filter_by_invalid_user_type(self):
+        """Deve retornar 400 para tipo de usuário inválido."""
+        response = self.client.get('/api/admin/users/', {'user_type': 'INVALID'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
 
 # ==================== TESTES DE INTEGRAÇÃO: ORDER VIEWSET ====================
 
@@ -496,6 +539,7 @@ class AdminSubscriptionViewSetTest(APITestCase, AdminTestMixin):
     """Testes de integração para AdminSubscriptionViewSet."""
     
     def setUp(self):
+        cache.clear()
         self.admin_user = self.create_admin_user()
         self.client.force_authenticate(user=self.admin_user)
         self.subscription = self.create_subscription()
@@ -511,6 +555,32 @@ class AdminSubscriptionViewSetTest(APITestCase, AdminTestMixin):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.subscription.refresh_from_db()
         self.assertEqual(self.subscription.status, SubscriptionStatus.CANCELLED.value)
+        self.assertIsNotNone(self.subscription.cancelled_at)
+        self.assertFalse(self.subscription.auto_renew)
+    
+    def test_cancel_cancelled_subscription_returns_400(self):
+        """Não deve cancelar uma assinatura que já está cancelada."""
+        self.subscription.status = SubscriptionStatus.CANCELLED.value
+        self.subscription.save()
+        
+        response = self.client.post(f'/api/admin/subscriptions/{self.subscription.id}/cancel/')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()['status'], SubscriptionStatus.CANCELLED.value)
+    
+    def test_cancel_non_active_subscription_returns_400(self):
+        """Apenas assinaturas ativas podem ser canceladas; as demais ficam inalteradas."""
+        for current_status in (SubscriptionStatus.SUSPENDED.value, SubscriptionStatus.EXPIRED.value):
+            with self.subTest(status=current_status):
+                self.subscription.status = current_status
+                self.subscription.save()
+                
+                response = self.client.post(f'/api/admin/subscriptions/{self.subscription.id}/cancel/')
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertEqual(response.json()['status'], current_status)
+                self.subscription.refresh_from_db()
+                self.assertEqual(self.subscription.status, current_status)
+                self.assertIsNone(self.subscription.cancelled_at)
+                self.assertTrue(self.subscription.auto_renew)
     
     def test_reactivate_subscription(self):
         """Deve reativar uma assinatura cancelada."""
@@ -529,6 +599,34 @@ class AdminSubscriptionViewSetTest(APITestCase, AdminTestMixin):
         self.subscription.refresh_from_db()
         self.assertEqual(self.subscription.status, SubscriptionStatus.SUSPENDED.value)
 
+    def test_reactivate_active_subscription_returns_400(self):
+        """Não deve reativar uma assinatura que já está ativa."""
+        response = self.client.post(f'/api/admin/subscriptions/{self.subscription.id}/reactivate/')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()['status'], SubscriptionStatus.ACTIVE.value)
+    
+    def test_suspend_cancelled_subscription_returns_400(self):
+        """Apenas assinaturas ativas podem ser suspensas."""
+        self.subscription.status = SubscriptionStatus.CANCELLED.value
+        self.subscription.save()
+        
+        response = self.client.post(f'/api/admin/subscriptions/{self.subscription.id}/suspend/')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.subscription.refresh_from_db()
+        self.assertEqual(self.subscription.status, SubscriptionStatus.CANCELLED.value)
+    
+    def test_suspend_nonexistent_subscription_returns_404(self):
+        """Deve retornar 404 ao suspender assinatura inexistente."""
+        response = self.client.post('/api/admin/subscriptions/999999/suspend/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_cancel_subscription_does_not_load_instance(self):
+        """Cancelar deve ser resolvido pelo UPDATE condicional, sem SELECT prévio."""
+        # UPDATE condicional + INSERT do log de auditoria
+        with self.assertNumQueries(2):
+            response = self.client.post(f'/api/admin/subscriptions/{self.subscription.id}/cancel/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
 
 # ==================== TESTES DE INTEGRAÇÃO: REVIEW VIEWSET ====================
 
@@ -536,6 +634,7 @@ class AdminReviewViewSetTest(APITestCase, AdminTestMixin):
     """Testes de integração para AdminReviewViewSet."""
     
     def setUp(self):
+        cache.clear()
         self.admin_user = self.create_admin_user()
         self.client.force_authenticate(user=self.admin_user)
         self.review = self.create_review()
@@ -555,11 +654,171 @@ class AdminReviewViewSetTest(APITestCase, AdminTestMixin):
         self.review.refresh_from_db()
         self.assertIsNotNone(self.review.deleted_at)
     
+    def test_delete_already_deleted_review_returns_404(self):
+        """Avaliações já removidas não devem ser encontradas."""
+        self.client.delete(f'/api/admin/reviews/{self.review.id}/')
+        response = self.client.delete(f'/api/admin/reviews/{self.review.id}/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+    
+    def test_partial_update_review(self):
+        """Deve atualizar apenas os campos de moderação da avaliação."""
+        original_reviewer_id = self.review.reviewer_id
+        response = self.client.patch(
+            f'/api/admin/reviews/{self.review.id}/',
+            {'rating': 2, 'comment': 'Comentário moderado', 'reviewer': self.admin_user.id},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['rating'], 2)
+        self.assertEqual(response.data['comment'], 'Comentário moderado')
+
+        self.review.refresh_from_db()
+        self.assertEqual(self.review.rating, 2)
+        self.assertEqual(self.review.reviewer_id, original_reviewer_id)
+
     def test_filter_by_rating(self):
         """Deve filtrar avaliações por nota."""
         response = self.client.get('/api/admin/reviews/', {'rating': 5})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_filter_by_invalid_rating_returns_400(self):
+        """Notas fora do intervalo 1-5 devem ser rejeitadas na validação."""
+        for rating in ('0', '6', 'abc'):
+            with self.subTest(rating=rating):
+                response = self.client.get('/api/admin/reviews/', {'rating': rating})
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+# ==================== TESTES DE INTEGRAÇÃO: CACHE DAS LISTAGENS ====================
+
+class AdminListCacheTest(APITestCase, AdminTestMixin):
+    """Testes de integração para o cache das listagens administrativas."""
+    
+    def setUp(self):
+        cache.clear()
+        self.admin_user = self.create_admin_user()
+        self.target_user = self.create_client_user()
+        self.client.force_authenticate(user=self.admin_user)
+    
+    def test_repeated_list_is_served_from_cache(self):
+        """A mesma listagem com os mesmos filtros não deve consultar o banco."""
+        params = {'user_type': UserType.CLIENT.value}
+        first = self.client.get('/api/admin/users/', params)
+        
+        with self.assertNumQueries(0):
+            second = self.client.get('/api/admin/users/', params)
+        
+        self.assertEqual(first.json(), second.json())
+    
+    def test_save_invalidates_cached_list(self):
+        """Salvar um modelo listado deve invalidar o cache."""
+        self.client.get('/api/admin/users/')
+        with self.captureOnCommitCallbacks(execute=True):
+            new_user = self.create_client_user()
+        
+        response = self.client.get('/api/admin/users/')
+        ids = [user['id'] for user in response.json()['results']]
+        self.assertIn(new_user.id, ids)
+    
+    def test_invalidation_waits_for_commit(self):
+        """A versão só muda após o commit: um save desfeito não invalida o cache."""
+        self.client.get('/api/admin/users/')
+        
+        with self.captureOnCommitCallbacks(execute=True) as callbacks, transaction.atomic():
+            self.create_client_user()
+            transaction.set_rollback(True)
+        self.assertEqual(callbacks, [])
+        with self.assertNumQueries(0):
+            self.client.get('/api/admin/users/')
+        
+        with self.captureOnCommitCallbacks() as callbacks:
+            new_user = self.create_client_user()
+        # Antes do commit a listagem em cache ainda é servida
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/admin/users/')
+        self.assertNotIn(new_user.id, [user['id'] for user in response.json()['results']])
+        
+        for callback in callbacks:
+            callback()
+        response = self.client.get('/api/admin/users/')
+        self.assertIn(new_user.id, [user['id'] for user in response.json()['results']])
+    
+    def test_update_action_invalidates_cached_list(self):
+        """Ações que usam UPDATE direto também devem invalidar o cache."""
+        self.client.get('/api/admin/users/', {'is_active': 'false'})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(f'/api/admin/users/{self.target_user.id}/suspend/')
+        
+        response = self.client.get('/api/admin/users/', {'is_active': 'false'})
+        ids = [user['id'] for user in response.json()['results']]
+        self.assertEqual(ids, [self.target_user.id])
+
+
+# ==================== TESTES DE INTEGRAÇÃO: LISTAGENS VIA .values() ====================
+
+class AdminValuesListTest(APITestCase, AdminTestMixin):
+    """As listagens montadas com .values() devem ter o mesmo formato do serializer."""
+    
+    def setUp(self):
+        cache.clear()
+        self.admin_user = self.create_admin_user()
+        self.client.force_authenticate(user=self.admin_user)
+    
+    def assertListMatchesRetrieve(self, url, obj_id):
+        rows = self.client.get(url).json()['results']
+        row = next(row for row in rows if row['id'] == obj_id)
+        detail = self.client.get(f'{url}{obj_id}/').json()
+        self.assertEqual(row, detail)
+        self.assertEqual(list(row), list(detail))
+    
+    def test_users_list_matches_serializer(self):
+        user = self.create_client_user()
+        self.assertListMatchesRetrieve('/api/admin/users/', user.id)
+    
+    def test_users_list_includes_related_counts(self):
+        """A listagem de usuários deve trazer contagens de assinaturas e avaliações."""
+        review = self.create_review()
+        reviewer = review.reviewer
+        self.create_subscription(user=reviewer)
+        self.create_subscription(user=reviewer)
+        
+        rows = self.client.get('/api/admin/users/').json()['results']
+        row = next(row for row in rows if row['id'] == reviewer.id)
+        self.assertEqual(row['subscription_count'], 2)
+        self.assertEqual(row['review_count'], 1)
+        
+        detail = self.client.get(f'/api/admin/users/{reviewer.id}/').json()
+        self.assertEqual(detail['subscription_count'], 2)
+        self.assertEqual(detail['review_count'], 1)
+    
+    def test_subscriptions_list_matches_serializer(self):
+        subscription = self.create_subscription()
+        self.assertListMatchesRetrieve('/api/admin/subscriptions/', subscription.id)
+    
+    def test_reviews_list_matches_serializer(self):
+        review = self.create_review()
+        self.assertListMatchesRetrieve('/api/admin/reviews/', review.id)
+    
+    def test_payments_list_matches_serializer(self):
+        proposal = self.create_proposal()
+        payment = Payment.objects.create(
+            order=proposal.order,
+            proposal=proposal,
+            amount=Decimal('300.00'),
+            payment_method='pix',
+            metadata={'gateway': 'test'},
+        )
+        self.assertListMatchesRetrieve('/api/admin/payments/', payment.id)
+    
+    def test_unpaginated_list_streams_rows(self):
+        """Sem paginação a listagem deve retornar todas as linhas, lidas em lotes."""
+        user = self.create_client_user()
+        with mock.patch.object(AdminUserViewSet, 'pagination_class', None):
+            response = self.client.get('/api/admin/users/')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual({row['id'] for row in response.json()}, {self.admin_user.id, user.id})
+
 
 # ==================== TESTES DE INTEGRAÇÃO: AUDIT LOG VIEWSET ====================
 
@@ -615,6 +874,7 @@ class AdminAuditMiddlewareTest(APITestCase, AdminTestMixin):
     """Testes de integração para AdminAuditMiddleware."""
     
     def setUp(self):
+        cache.clear()
         self.admin_user = self.create_admin_user()
         self.target_user = self.create_client_user()
         self.client.force_authenticate(user=self.admin_user)
@@ -730,6 +990,9 @@ class AdminE2ETest(APITestCase, AdminTestMixin):
     Teste E2E: Admin acessa dashboard → gerencia usuários → verifica logs de auditoria.
     """
     
+    def setUp(self):
+        cache.clear()
+    
     def test_admin_full_flow(self):
         """Testa fluxo completo de administração."""
         # 1. Criar admin e autenticar
@@ -6,7 +6,9 @@ from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
 
+from api.admin.pagination import UNPAGINATED_CHUNK_SIZE
 from api.admin.permissions import IsAdmin
+from api.admin.serializers import AdminAuditLogSerializer
 from api.admin.models import AdminAction
 
 
@@ -54,31 +56,7 @@ class AdminAuditLogViewSet(viewsets.ReadOnlyModelViewSet):
     """
     queryset = AdminAction.objects.select_related('admin_user')
     permission_classes = [IsAdmin]
-    serializer_class = None
-
-    def get_serializer_class(self):
-        """Retorna o serializer apropriado."""
-        from rest_framework.serializers import ModelSerializer, SerializerMethodField
-        
-        class AuditLogSerializer(ModelSerializer):
-            admin_email = SerializerMethodField()
-            
-            class Meta:
-                model = AdminAction
-                fields = [
-                    'id', 'admin_user', 'admin_email', 'action_type',
-                    'target_model', 'target_id', 'description', 'metadata',
-                    'ip_address', 'created_at'
-                ]
-                read_only_fields = [
-                    'id', 'admin_user', 'action_type', 'target_model',
-                    'target_id', 'description', 'metadata', 'ip_address', 'created_at'
-                ]
-            
-            def get_admin_email(self, obj):
-                return obj.admin_user.email if obj.admin_user else None
-        
-        return AuditLogSerializer
+    serializer_class = AdminAuditLogSerializer
 
     def list(self, request, *args, **kwargs):
         """Lista todos os logs de auditoria."""
@@ -113,7 +91,7 @@ class AdminAuditLogViewSet(viewsets.ReadOnlyModelViewSet):
             serializer = self.get_serializer(page, many=True)
             return self.get_paginated_response(serializer.data)
         
-        serializer = self.get_serializer(queryset, many=True)
+        serializer = self.get_serializer(queryset.iterator(chunk_size=UNPAGINATED_CHUNK_SIZE), many=True)
         return Response(serializer.data)
 
     def retrieve(self, request, *args, **kwargs):
@@ -6,7 +6,9 @@ from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
 
+from api.admin.pagination import UNPAGINATED_CHUNK_SIZE
 from api.admin.permissions import IsAdmin
+from api.admin.serializers import AdminOrderSerializer, AdminProposalSerializer
 from api.orders.models import Order, Proposal
 
 
@@ -33,25 +35,9 @@ class AdminOrderViewSet(viewsets.ReadOnlyModelViewSet):
     
     **Permissão necessária:** IsAdmin
     """
-    queryset = Order.objects.select_related('client', 'client__user', 'service', 'service__category')
+    queryset = Order.objects.with_relations()
     permission_classes = [IsAdmin]
-    serializer_class = None
-
-    def get_serializer_class(self):
-        """Retorna o serializer apropriado."""
-        from rest_framework.serializers import ModelSerializer
-        
-        class OrderSerializer(ModelSerializer):
-            class Meta:
-                model = Order
-                fields = [
-                    'id', 'client', 'service', 'title', 'description',
-                    'budget_min', 'budget_max', 'deadline', 'status',
-                    'created_at', 'updated_at'
-                ]
-                read_only_fields = ['id', 'created_at', 'updated_at']
-        
-        return OrderSerializer
+    serializer_class = AdminOrderSerializer
 
     def list(self, request, *args, **kwargs):
         """Lista todos os pedidos."""
@@ -66,7 +52,7 @@ class AdminOrderViewSet(viewsets.ReadOnlyModelViewSet):
             serializer = self.get_serializer(page, many=True)
             return self.get_paginated_response(serializer.data)
         
-        serializer = self.get_serializer(queryset, many=True)
+        serializer = self.get_serializer(queryset.iterator(chunk_size=UNPAGINATED_CHUNK_SIZE), many=True)
         return Response(serializer.data)
 
     def retrieve(self, request, *args, **kwargs):
@@ -99,25 +85,9 @@ class AdminProposalViewSet(viewsets.ReadOnlyModelViewSet):
     
     **Permissão necessária:** IsAdmin
     """
-    queryset = Proposal.objects.select_related('order', 'provider', 'provider__user')
+    queryset = Proposal.objects.with_relations()
     permission_classes = [IsAdmin]
-    serializer_class = None
-
-    def get_serializer_class(self):
-        """Retorna o serializer apropriado."""
-        from rest_framework.serializers import ModelSerializer
-        
-        class ProposalSerializer(ModelSerializer):
-            class Meta:
-                model = Proposal
-                fields = [
-                    'id', 'order', 'provider', 'message', 'price',
-                    'estimated_days', 'status', 'created_at', 'updated_at',
-                    'expires_at'
-                ]
-                read_only_fields = ['id', 'created_at', 'updated_at']
-        
-        return ProposalSerializer
+    serializer_class = AdminProposalSerializer
 
     def list(self, request, *args, **kwargs):
         """Lista todas as propostas."""
@@ -132,7 +102,7 @@ class AdminProposalViewSet(viewsets.ReadOnlyModelViewSet):
             serializer = self.get_serializer(page, many=True)
             return self.get_paginated_response(serializer.data)
         
-        serializer = self.get_serializer(queryset, many=True)
+        serializer = self.get_serializer(queryset.iterator(chunk_size=UNPAGINATED_CHUNK_SIZE), many=True)
         return Response(serializer.data)
 
     def retrieve(self, request, *args, **kwargs):
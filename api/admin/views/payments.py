@@ -3,10 +3,16 @@ ViewSet para visualização de pagamentos pelo administrador.
 """
 from rest_framework import viewsets
 from rest_framework.response import Response
+from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
 
+from api.admin.cache import CachedListMixin
+from api.admin.filters import AdminPaymentFilter
+from api.admin.mixins import ValuesListMixin
+from api.admin.pagination import AdminCursorPagination
 from api.admin.permissions import IsAdmin
+from api.admin.serializers import AdminPaymentSerializer
 from api.payments.models import Payment
 
 
@@ -25,7 +31,7 @@ from api.payments.models import Payment
         description='Retorna informações detalhadas de um pagamento específico.',
     ),
 )
-class AdminPaymentViewSet(viewsets.ReadOnlyModelViewSet):
+class AdminPaymentViewSet(CachedListMixin, ValuesListMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet para visualização de pagamentos pelo administrador.
     
@@ -35,39 +41,15 @@ class AdminPaymentViewSet(viewsets.ReadOnlyModelViewSet):
     """
     queryset = Payment.objects.select_related('order', 'proposal')
     permission_classes = [IsAdmin]
-    serializer_class = None
-
-    def get_serializer_class(self):
-        """Retorna o serializer apropriado."""
-        from rest_framework.serializers import ModelSerializer
-        
-        class PaymentSerializer(ModelSerializer):
-            class Meta:
-                model = Payment
-                fields = [
-                    'id', 'order', 'proposal', 'amount', 'payment_method',
-                    'payment_status', 'transaction_id', 'payment_date',
-                    'metadata', 'created_at', 'updated_at'
-                ]
-                read_only_fields = ['id', 'created_at', 'updated_at']
-        
-        return PaymentSerializer
-
-    def list(self, request, *args, **kwargs):
-        """Lista todos os pagamentos."""
-        queryset = self.get_queryset()
-        
-        status_filter = request.query_params.get('status')
-        if status_filter:
-            queryset = queryset.filter(payment_status=status_filter)
-        
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+    serializer_class = AdminPaymentSerializer
+    pagination_class = AdminCursorPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = AdminPaymentFilter
+    list_fields = (
+        'id', 'order', 'proposal', 'amount', 'payment_method',
+        'payment_status', 'transaction_id', 'payment_date',
+        'metadata', 'created_at', 'updated_at',
+    )
 
     def retrieve(self, request, *args, **kwargs):
         """Retorna detalhes de um pagamento específico."""
@@ -1,12 +1,22 @@
 """
 ViewSet para gerenciamento de avaliações pelo administrador.
 """
+from django.db.models import F
+from django.http import Http404
+from django.utils import timezone
 from rest_framework import viewsets, status
 from rest_framework.response import Response
+from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter, OpenApiResponse
 from drf_spectacular.types import OpenApiTypes
 
+from api.admin.cache import CachedListMixin
+from api.admin.filters import AdminReviewFilter
+from api.admin.mixins import ValuesListMixin
+from api.admin.pagination import AdminCursorPagination
 from api.admin.permissions import IsAdmin
+from api.admin.serializers import AdminReviewSerializer
+from api.admin.signals import invalidate_admin_lists_for_model
 from api.reviews.models import Review
 
 
@@ -46,7 +56,7 @@ from api.reviews.models import Review
         },
     ),
 )
-class AdminReviewViewSet(viewsets.ModelViewSet):
+class AdminReviewViewSet(CachedListMixin, ValuesListMixin, viewsets.ModelViewSet):
     """
     ViewSet para gerenciamento de avaliações pelo administrador.
     
@@ -56,67 +66,21 @@ class AdminReviewViewSet(viewsets.ModelViewSet):
     """
     queryset = Review.objects.select_related('order', 'reviewer', 'reviewed_user')
     permission_classes = [IsAdmin]
-    serializer_class = None
-
-    def get_serializer_class(self):
-        """Retorna o serializer apropriado."""
-        from rest_framework.serializers import ModelSerializer, SerializerMethodField
-        
-        class ReviewSerializer(ModelSerializer):
-            reviewer_email = SerializerMethodField()
-            reviewed_user_email = SerializerMethodField()
-            order_title = SerializerMethodField()
-            
-            class Meta:
-                model = Review
-                fields = [
-                    'id', 'order', 'order_title', 'reviewer', 'reviewer_email',
-                    'reviewed_user', 'reviewed_user_email', 'rating', 'comment',
-                    'created_at', 'updated_at'
-                ]
-                read_only_fields = [
-                    'id', 'reviewer_email', 'reviewed_user_email', 'order_title',
-                    'created_at', 'updated_at'
-                ]
-            
-            def get_reviewer_email(self, obj):
-                return obj.reviewer.email if obj.reviewer else None
-            
-            def get_reviewed_user_email(self, obj):
-                return obj.reviewed_user.email if obj.reviewed_user else None
-            
-            def get_order_title(self, obj):
-                return obj.order.title if obj.order else None
-        
-        return ReviewSerializer
-
-    def list(self, request, *args, **kwargs):
-        """Lista todas as avaliações."""
-        queryset = self.get_queryset()
-        
-        rating_filter = request.query_params.get('rating')
-        if rating_filter:
-            queryset = queryset.filter(rating=rating_filter)
-        
-        reviewer_filter = request.query_params.get('reviewer')
-        if reviewer_filter:
-            queryset = queryset.filter(reviewer_id=reviewer_filter)
-        
-        reviewed_user_filter = request.query_params.get('reviewed_user')
-        if reviewed_user_filter:
-            queryset = queryset.filter(reviewed_user_id=reviewed_user_filter)
-        
-        order_filter = request.query_params.get('order')
-        if order_filter:
-            queryset = queryset.filter(order_id=order_filter)
-        
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+    serializer_class = AdminReviewSerializer
+    lookup_value_regex = r'\d+'
+    pagination_class = AdminCursorPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = AdminReviewFilter
+    list_fields = (
+        'id', 'order', 'order_title', 'reviewer', 'reviewer_email',
+        'reviewed_user', 'reviewed_user_email', 'rating', 'comment',
+        'created_at', 'updated_at',
+    )
+    list_expressions = {
+        'order_title': F('order__title'),
+        'reviewer_email': F('reviewer__email'),
+        'reviewed_user_email': F('reviewed_user__email'),
+    }
 
     def retrieve(self, request, *args, **kwargs):
         """Retorna detalhes de uma avaliação específica."""
@@ -130,18 +94,18 @@ class AdminReviewViewSet(viewsets.ModelViewSet):
         instance = self.get_object()
         serializer = self.get_serializer(instance, data=request.data, partial=partial)
         serializer.is_valid(raise_exception=True)
-        
-        instance.rating = serializer.validated_data.get('rating', instance.rating)
-        instance.comment = serializer.validated_data.get('comment', instance.comment)
-        instance.save(update_fields=['rating', 'comment', 'updated_at'])
-        
-        return Response(self.get_serializer(instance).data)
+        serializer.save()
+        return Response(serializer.data)
 
     def destroy(self, request, *args, **kwargs):
-        """Remove uma avaliação (soft delete para moderação)."""
-        instance = self.get_object()
-        review_id = instance.id
-        instance.delete()  # SoftDelete
+        """Remove uma avaliação (soft delete para moderação) com um único UPDATE."""
+        review_id = int(kwargs['pk'])
+        updated = self.get_queryset().filter(pk=review_id).update(deleted_at=timezone.now())
+        if not updated:
+            raise Http404
+        
+        # UPDATE direto não dispara post_save
+        invalidate_admin_lists_for_model(Review)
         
         return Response({
             'message': f'Avaliação #{review_id} foi removida com sucesso.',
@@ -1,16 +1,33 @@
 """
 ViewSet para gerenciamento de assinaturas pelo administrador.
 """
+from django.db.models import BooleanField, Case, ExpressionWrapper, F, Q, Value, When
+from django.db.models.functions import Now
+from django.http import Http404
+from django.utils import timezone
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter, OpenApiResponse
 from drf_spectacular.types import OpenApiTypes
 
+from api.admin.cache import CachedListMixin
+from api.admin.filters import AdminSubscriptionFilter
+from api.admin.mixins import ValuesListMixin
+from api.admin.pagination import AdminCursorPagination
 from api.admin.permissions import IsAdmin
+from api.admin.serializers import AdminSubscriptionSerializer
+from api.admin.signals import invalidate_admin_lists_for_model
 from api.subscriptions.models import UserSubscription
 from api.subscriptions.enums import SubscriptionStatus
 
+# Valores de status resolvidos uma vez no import (evita o acesso ao Enum
+# em cada requisição das actions de mudança de estado).
+_STATUS_ACTIVE = SubscriptionStatus.ACTIVE.value
+_STATUS_CANCELLED = SubscriptionStatus.CANCELLED.value
+_STATUS_SUSPENDED = SubscriptionStatus.SUSPENDED.value
+
 
 @extend_schema_view(
     list=extend_schema(
@@ -34,7 +51,7 @@ from api.subscriptions.enums import SubscriptionStatus
         description='Cancela uma assinatura ativa. A assinatura permanece válida até o fim do período.',
         responses={
             200: OpenApiResponse(description='Assinatura cancelada com sucesso'),
-            400: OpenApiResponse(description='Assinatura já está cancelada'),
+            400: OpenApiResponse(description='Assinatura já está cancelada ou não está ativa'),
         },
     ),
     reactivate=extend_schema(
@@ -56,7 +73,7 @@ from api.subscriptions.enums import SubscriptionStatus
         },
     ),
 )
-class AdminSubscriptionViewSet(viewsets.ModelViewSet):
+class AdminSubscriptionViewSet(CachedListMixin, ValuesListMixin, viewsets.ModelViewSet):
     """
     ViewSet para gerenciamento de assinaturas pelo administrador.
     
@@ -67,59 +84,23 @@ class AdminSubscriptionViewSet(viewsets.ModelViewSet):
     """
     queryset = UserSubscription.objects.select_related('user', 'plan')
     permission_classes = [IsAdmin]
-    serializer_class = None
-
-    def get_serializer_class(self):
-        """Retorna o serializer apropriado."""
-        from rest_framework.serializers import ModelSerializer, SerializerMethodField
-        
-        class SubscriptionSerializer(ModelSerializer):
-            user_email = SerializerMethodField()
-            plan_name = SerializerMethodField()
-            
-            class Meta:
-                model = UserSubscription
-                fields = [
-                    'id', 'user', 'user_email', 'plan', 'plan_name', 'status',
-                    'start_date', 'end_date', 'auto_renew', 'cancelled_at',
-                    'is_active', 'is_expired', 'created_at', 'updated_at'
-                ]
-                read_only_fields = [
-                    'id', 'user_email', 'plan_name', 'is_active', 'is_expired',
-                    'created_at', 'updated_at'
-                ]
-            
-            def get_user_email(self, obj):
-                return obj.user.email if obj.user else None
-            
-            def get_plan_name(self, obj):
-                return obj.plan.name if obj.plan else None
-        
-        return SubscriptionSerializer
-
-    def list(self, request, *args, **kwargs):
-        """Lista todas as assinaturas."""
-        queryset = self.get_queryset()
-        
-        status_filter = request.query_params.get('status')
-        if status_filter:
-            queryset = queryset.filter(status=status_filter)
-        
-        plan_filter = request.query_params.get('plan')
-        if plan_filter:
-            queryset = queryset.filter(plan_id=plan_filter)
-        
-        user_filter = request.query_params.get('user')
-        if user_filter:
-            queryset = queryset.filter(user_id=user_filter)
-        
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+    serializer_class = AdminSubscriptionSerializer
+    lookup_value_regex = r'\d+'
+    pagination_class = AdminCursorPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = AdminSubscriptionFilter
+    list_fields = (
+        'id', 'user', 'user_email', 'plan', 'plan_name', 'status',
+        'start_date', 'end_date', 'auto_renew', 'cancelled_at',
+        'is_active', 'is_expired', 'created_at', 'updated_at',
+    )
+    list_expressions = {
+        'user_email': F('user__email'),
+        'plan_name': F('plan__name'),
+        # Equivalentes SQL das propriedades UserSubscription.is_active/is_expired
+        'is_active': ExpressionWrapper(Q(status=_STATUS_ACTIVE), output_field=BooleanField()),
+        'is_expired': Case(When(end_date__lt=Now(), then=Value(True)), default=Value(False), output_field=BooleanField()),
+    }
 
     def retrieve(self, request, *args, **kwargs):
         """Retorna detalhes de uma assinatura específica."""
@@ -129,71 +110,98 @@ class AdminSubscriptionViewSet(viewsets.ModelViewSet):
 
     @action(detail=True, methods=['post'], url_path='cancel')
     def cancel(self, request, pk=None):
-        """Cancela uma assinatura."""
-        subscription = self.get_object()
-        
-        if subscription.status == SubscriptionStatus.CANCELLED.value:
+        """Cancela uma assinatura ativa (mesma regra de UserSubscription.cancel())."""
+        queryset = self.get_queryset().filter(pk=pk)
+        cancelled_at = timezone.now()
+        updated = queryset.filter(status=_STATUS_ACTIVE).update(
+            status=_STATUS_CANCELLED,
+            cancelled_at=cancelled_at,
+            auto_renew=False,
+        )
+        
+        if not updated:
+            current_status = self._get_status_or_404(queryset)
+            if current_status == _STATUS_CANCELLED:
+                error = 'Esta assinatura já está cancelada.'
+            else:
+                error = 'Apenas assinaturas ativas podem ser canceladas.'
             return Response({
-                'error': 'Esta assinatura já está cancelada.',
-                'subscription_id': subscription.id,
-                'status': subscription.status,
+                'error': error,
+                'subscription_id': int(pk),
+                'status': current_status,
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        subscription.cancel()
-        
+        # UPDATE direto não dispara post_save
+        invalidate_admin_lists_for_model(UserSubscription)
         return Response({
-            'message': f'Assinatura #{subscription.id} foi cancelada com sucesso.',
-            'subscription_id': subscription.id,
-            'status': subscription.status,
-            'cancelled_at': subscription.cancelled_at,
+            'message': f'Assinatura #{pk} foi cancelada com sucesso.',
+            'subscription_id': int(pk),
+            'status': _STATUS_CANCELLED,
+            'cancelled_at': cancelled_at,
         }, status=status.HTTP_200_OK)
 
     @action(detail=True, methods=['post'], url_path='reactivate')
     def reactivate(self, request, pk=None):
         """Reativa uma assinatura cancelada ou suspensa."""
-        subscription = self.get_object()
-        
-        if subscription.status == SubscriptionStatus.ACTIVE.value:
+        queryset = self.get_queryset().filter(pk=pk)
+        updated = queryset.exclude(status=_STATUS_ACTIVE).update(
+            status=_STATUS_ACTIVE,
+            cancelled_at=None,
+        )
+        
+        if not updated:
+            current_status = self._get_status_or_404(queryset)
             return Response({
                 'error': 'Esta assinatura já está ativa.',
-                'subscription_id': subscription.id,
-                'status': subscription.status,
+                'subscription_id': int(pk),
+                'status': current_status,
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        subscription.status = SubscriptionStatus.ACTIVE.value
-        subscription.cancelled_at = None
-        subscription.save(update_fields=['status', 'cancelled_at'])
-        
+        # UPDATE direto não dispara post_save
+        invalidate_admin_lists_for_model(UserSubscription)
         return Response({
-            'message': f'Assinatura #{subscription.id} foi reativada com sucesso.',
-            'subscription_id': subscription.id,
-            'status': subscription.status,
+            'message': f'Assinatura #{pk} foi reativada com sucesso.',
+            'subscription_id': int(pk),
+            'status': _STATUS_ACTIVE,
         }, status=status.HTTP_200_OK)
 
     @action(detail=True, methods=['post'], url_path='suspend')
     def suspend(self, request, pk=None):
         """Suspende uma assinatura ativa."""
-        subscription = self.get_object()
-        
-        if subscription.status == SubscriptionStatus.SUSPENDED.value:
+        queryset = self.get_queryset().filter(pk=pk)
+        updated = queryset.filter(status=_STATUS_ACTIVE).update(
+            status=_STATUS_SUSPENDED,
+        )
+        
+        if not updated:
+            current_status = self._get_status_or_404(queryset)
+            if current_status == _STATUS_SUSPENDED:
+                error = 'Esta assinatura já está suspensa.'
+            else:
+                error = 'Apenas assinaturas ativas podem ser suspensas.'
             return Response({
-                'error': 'Esta assinatura já está suspensa.',
-                'subscription_id': subscription.id,
-                'status': subscription.status,
+                'error': error,
+                'subscription_id': int(pk),
+                'status': current_status,
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        if subscription.status != SubscriptionStatus.ACTIVE.value:
-            return Response({
-                'error': 'Apenas assinaturas ativas podem ser suspensas.',
-                'subscription_id': subscription.id,
-                'status': subscription.status,
-            }, status=status.HTTP_400_BAD_REQUEST)
-        
-        subscription.status = SubscriptionStatus.SUSPENDED.value
-        subscription.save(update_fields=['status'])
-        
+        # UPDATE direto não dispara post_save
+        invalidate_admin_lists_for_model(UserSubscription)
         return Response({
-            'message': f'Assinatura #{subscription.id} foi suspensa com sucesso.',
-            'subscription_id': subscription.id,
-            'status': subscription.status,
+            'message': f'Assinatura #{pk} foi suspensa com sucesso.',
+            'subscription_id': int(pk),
+            'status': _STATUS_SUSPENDED,
         }, status=status.HTTP_200_OK)
+
+    @staticmethod
+    def _get_status_or_404(queryset):
+        """
+        Retorna o status atual da assinatura ou levanta 404.
+        
+        Usado apenas quando o UPDATE condicional não afetou nenhuma linha,
+        para diferenciar "não existe" de "já está no estado alvo".
+        """
+        current_status = queryset.values_list('status', flat=True).first()
+        if current_status is None:
+            raise Http404
+        return current_status
@@ -1,9 +1,13 @@
 """
 ViewSet para gerenciamento de usuários pelo administrador.
 """
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.http import Http404
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import (
     extend_schema,
     extend_schema_view,
@@ -13,8 +17,33 @@ from drf_spectacular.utils import (
 )
 from drf_spectacular.types import OpenApiTypes
 
+from api.admin.cache import CachedListMixin
+from api.admin.filters import AdminUserFilter
+from api.admin.mixins import ValuesListMixin
+from api.admin.pagination import AdminCursorPagination
 from api.admin.permissions import IsAdmin
+from api.admin.serializers import AdminUserSerializer
+from api.admin.signals import invalidate_admin_lists_for_model
 from api.accounts.models import User
+from api.reviews.models import Review
+from api.subscriptions.models import UserSubscription
+
+
+def _count_subquery(model, fk_field):
+    """
+    Subquery correlacionada que conta registros de `model` apontando para o usuário.
+    
+    Preferida a Count() com JOIN porque várias contagens no mesmo queryset
+    multiplicariam as linhas (produto cartesiano) antes do GROUP BY.
+    """
+    counts = (
+        model.objects.filter(**{fk_field: OuterRef('pk')})
+        .order_by()
+        .values(fk_field)
+        .annotate(total=Count('pk'))
+        .values('total')
+    )
+    return Coalesce(Subquery(counts), 0)
 
 
 @extend_schema_view(
@@ -75,7 +104,7 @@ from api.accounts.models import User
         },
     ),
 )
-class AdminUserViewSet(viewsets.ModelViewSet):
+class AdminUserViewSet(CachedListMixin, ValuesListMixin, viewsets.ModelViewSet):
     """
     ViewSet para gerenciamento de usuários pelo administrador.
     
@@ -83,46 +112,23 @@ class AdminUserViewSet(viewsets.ModelViewSet):
     
     **Permissão necessária:** IsAdmin
     """
-    queryset = User.objects.all()
+    queryset = User.objects.annotate(
+        subscription_count=_count_subquery(UserSubscription, 'user'),
+        review_count=_count_subquery(Review, 'reviewer'),
+    )
     permission_classes = [IsAdmin]
-    serializer_class = None
+    serializer_class = AdminUserSerializer
     lookup_field = 'pk'
-
-    def get_serializer_class(self):
-        """Retorna o serializer apropriado baseado na ação."""
-        from rest_framework.serializers import ModelSerializer
-        
-        class UserSerializer(ModelSerializer):
-            class Meta:
-                model = User
-                fields = [
-                    'id', 'email', 'first_name', 'last_name', 'phone',
-                    'user_type', 'is_active', 'is_staff', 'is_superuser',
-                    'date_joined', 'last_login', 'created_at', 'updated_at'
-                ]
-                read_only_fields = ['id', 'date_joined', 'last_login', 'created_at', 'updated_at']
-        
-        return UserSerializer
-
-    def list(self, request, *args, **kwargs):
-        """Lista todos os usuários."""
-        queryset = self.get_queryset()
-        
-        user_type = request.query_params.get('user_type')
-        if user_type:
-            queryset = queryset.filter(user_type=user_type)
-        
-        is_active = request.query_params.get('is_active')
-        if is_active is not None:
-            queryset = queryset.filter(is_active=is_active.lower() == 'true')
-        
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+    lookup_value_regex = r'\d+'
+    pagination_class = AdminCursorPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = AdminUserFilter
+    list_fields = (
+        'id', 'email', 'first_name', 'last_name', 'phone',
+        'user_type', 'is_active', 'is_staff', 'is_superuser',
+        'date_joined', 'last_login', 'created_at', 'updated_at',
+        'subscription_count', 'review_count',
+    )
 
     def retrieve(self, request, *args, **kwargs):
         """Retorna detalhes de um usuário específico."""
@@ -141,24 +147,29 @@ class AdminUserViewSet(viewsets.ModelViewSet):
 
     @action(detail=True, methods=['post'], url_path='suspend')
     def suspend(self, request, pk=None):
-        """Suspende um usuário (desativa)."""
-        user = self.get_object()
-        user.is_active = False
-        user.save(update_fields=['is_active'])
-        return Response({
-            'message': f'Usuário {user.email} foi suspenso com sucesso.',
-            'user_id': user.id,
-            'is_active': user.is_active,
-        }, status=status.HTTP_200_OK)
+        """Suspende um usuário (desativa) com um único UPDATE."""
+        return self._set_active(pk, False, 'suspenso')
 
     @action(detail=True, methods=['post'], url_path='activate')
     def activate(self, request, pk=None):
-        """Ativa um usuário."""
-        user = self.get_object()
-        user.is_active = True
-        user.save(update_fields=['is_active'])
+        """Ativa um usuário com um único UPDATE."""
+        return self._set_active(pk, True, 'ativado')
+
+    def _set_active(self, pk, is_active, verb):
+        """
+        Atualiza `is_active` direto no banco, sem carregar a instância.
+
+        A contagem de linhas afetadas decide o 404, evitando o SELECT
+        completo de `get_object()` antes do UPDATE.
+        """
+        queryset = self.get_queryset().filter(pk=pk)
+        if not queryset.update(is_active=is_active):
+            raise Http404
+        # UPDATE direto não dispara post_save
+        invalidate_admin_lists_for_model(User)
+        email = queryset.values_list('email', flat=True).first()
         return Response({
-            'message': f'Usuário {user.email} foi ativado com sucesso.',
-            'user_id': user.id,
-            'is_active': user.is_active,
+            'message': f'Usuário {email} foi {verb} com sucesso.',
+            'user_id': int(pk),
+            'is_active': is_active,
         }, status=status.HTTP_200_OK)
@@ -0,0 +1,77 @@
+"""
+Cache dos contadores de mensagens não lidas do chat.
+
+O contador de não lidas é lido a cada consulta do badge da conversa, mas só
+muda quando uma mensagem é enviada, lida ou removida. Por isso é mantido no
+cache por (destinatário, sala) e recalculado com um COUNT só depois dessas
+alterações.
+
+A invalidação usa uma "geração" por (destinatário, sala) que faz parte da
+chave do contador, como a versão das listagens em `api.admin.cache`: cada
+envio, leitura ou remoção feita pelo modelo (save, UPDATE/DELETE em lote pelo
+queryset de mensagens, hard delete) troca a geração, e as entradas antigas
+deixam de ser encontradas. A leitura obtém a geração antes do COUNT e grava o
+resultado na chave dessa geração; se uma escrita terminar entre o COUNT e a
+gravação, o valor fica numa geração já abandonada e nunca é servido.
+
+As trocas de geração e as gravações são registradas com
+`transaction.on_commit`: uma transação desfeita não mexe no cache, e um COUNT
+que enxergou dados ainda não confirmados só é gravado após o commit.
+
+O TTL é longo: a correção depende da troca de geração, não da expiração.
+"""
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+UNREAD_COUNT_CACHE_TIMEOUT = 60 * 60 * 24  # 24 horas
+UNREAD_COUNT_CACHE_PREFIX = 'chat:unread'
+
+
+def _generation_key(room_id, recipient_id) -> str:
+    return f'{UNREAD_COUNT_CACHE_PREFIX}:{recipient_id}:{room_id}:generation'
+
+
+def get_unread_count_generation(room_id, recipient_id) -> int:
+    """Retorna a geração atual do contador, criando-a se necessário."""
+    return cache.get_or_set(_generation_key(room_id, recipient_id), time.time_ns, None)
+
+
+def get_unread_count_cache_key(room_id, recipient_id, generation) -> str:
+    return f'{UNREAD_COUNT_CACHE_PREFIX}:{recipient_id}:{room_id}:{generation}'
+
+
+def get_cached_unread_count(room_id, recipient_id, generation):
+    """Retorna o contador da geração informada ou None se não houver entrada."""
+    return cache.get(get_unread_count_cache_key(room_id, recipient_id, generation))
+
+
+def add_unread_count(room_id, recipient_id, generation, count: int) -> None:
+    """
+    Grava o contador recalculado na geração obtida antes do COUNT, após o
+    commit da transação atual.
+
+    Usa `add`: não sobrescreve um valor já gravado para a mesma geração.
+    """
+    key = get_unread_count_cache_key(room_id, recipient_id, generation)
+    transaction.on_commit(lambda: cache.add(key, count, UNREAD_COUNT_CACHE_TIMEOUT))
+
+
+def invalidate_unread_count(room_id, recipient_id) -> None:
+    """Troca a geração do contador, após o commit da transação atual."""
+    invalidate_unread_counts([(room_id, recipient_id)])
+
+
+def invalidate_unread_counts(keys) -> None:
+    """
+    Troca a geração de vários contadores, após o commit da transação atual.
+
+    Args:
+        keys: Pares (room_id, recipient_id)
+    """
+    generation_keys = [_generation_key(room_id, recipient_id) for room_id, recipient_id in set(keys)]
+    if generation_keys:
+        transaction.on_commit(
+            lambda: cache.set_many(dict.fromkeys(generation_keys, time.time_ns()), None)
+        )
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:22
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0001_initial'),
+        ('orders', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='chatroom',
+            name='chatroom_deleted_at_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='message',
+            name='message_deleted_at_idx',
+        ),
+        migrations.AddIndex(
+            model_name='chatroom',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['deleted_at'], name='chatroom_deleted_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['deleted_at'], name='message_deleted_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['room', 'created_at'], name='message_room_created_live_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:24
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0002_partial_live_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='message',
+            name='message_room_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='message',
+            name='message_created_at_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='message',
+            name='message_is_read_idx',
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True), ('is_read', False)), fields=['room', 'is_read', 'sender'], name='message_room_unread_idx'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:25
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0003_message_composite_indexes'),
+        ('orders', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='chatroom',
+            name='chatroom_client_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='chatroom',
+            name='chatroom_provider_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='chatroom',
+            name='chatroom_last_message_at_idx',
+        ),
+        migrations.AddIndex(
+            model_name='chatroom',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['client', '-last_message_at', '-created_at'], name='chatroom_client_lastmsg_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='chatroom',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['provider', '-last_message_at', '-created_at'], name='chatroom_provider_lastmsg_idx'),
+        ),
+    ]
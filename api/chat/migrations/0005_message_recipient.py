@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:30
+# Editado manualmente para preencher o destinatário das mensagens existentes
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_recipient(apps, schema_editor):
+    """Preenche recipient com o outro participante da sala de cada mensagem."""
+    ChatRoom = apps.get_model('chat', 'ChatRoom')
+    Message = apps.get_model('chat', 'Message')
+
+    rooms = ChatRoom.objects.filter(pk=OuterRef('room_id'))
+    sent_by_client = Message.objects.filter(sender_id=Subquery(rooms.values('client_id')))
+
+    sent_by_client.update(recipient_id=Subquery(rooms.values('provider_id')))
+    Message.objects.exclude(pk__in=sent_by_client.values('pk')).update(
+        recipient_id=Subquery(rooms.values('client_id'))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0004_chatroom_listing_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='message',
+            name='recipient',
+            field=models.ForeignKey(blank=True, help_text='Participante da sala que recebe a mensagem (preenchido automaticamente)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='received_messages', to=settings.AUTH_USER_MODEL, verbose_name='Destinatário'),
+        ),
+        migrations.RunPython(backfill_recipient, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='message',
+            name='recipient',
+            field=models.ForeignKey(blank=True, help_text='Participante da sala que recebe a mensagem (preenchido automaticamente)', on_delete=django.db.models.deletion.CASCADE, related_name='received_messages', to=settings.AUTH_USER_MODEL, verbose_name='Destinatário'),
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True), ('is_read', False)), fields=['recipient', 'is_read'], name='message_recipient_unread_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0005_message_recipient'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='message',
+            name='message_room_created_live_idx',
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['room', 'created_at'], include=('sender', 'message_type', 'is_read'), name='message_room_created_cover_idx'),
+        ),
+    ]
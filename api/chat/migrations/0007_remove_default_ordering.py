@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:44
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0006_message_covering_index'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='chatroom',
+            options={'ordering': [], 'verbose_name': 'Sala de Chat', 'verbose_name_plural': 'Salas de Chat'},
+        ),
+        migrations.AlterModelOptions(
+            name='message',
+            options={'ordering': [], 'verbose_name': 'Mensagem', 'verbose_name_plural': 'Mensagens'},
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:48
+# Editado manualmente para preencher os dados da última mensagem das salas existentes
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+from django.db.models.functions import Substr
+
+
+def backfill_last_message(apps, schema_editor):
+    """Copia prévia, remetente e tipo da mensagem mais recente de cada sala."""
+    ChatRoom = apps.get_model('chat', 'ChatRoom')
+    Message = apps.get_model('chat', 'Message')
+
+    latest = Message.objects.filter(
+        room_id=OuterRef('pk'),
+        deleted_at__isnull=True,
+    ).order_by('-created_at', '-pk')
+
+    ChatRoom.objects.filter(last_message_at__isnull=False).update(
+        last_message_preview=Subquery(latest.values(preview=Substr('content', 1, 200))[:1]),
+        last_message_sender_id=Subquery(latest.values('sender_id')[:1]),
+        last_message_type=Subquery(latest.values('message_type')[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0007_remove_default_ordering'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='chatroom',
+            name='last_message_preview',
+            field=models.CharField(blank=True, help_text='Início do conteúdo da última mensagem enviada na sala', max_length=200, null=True, verbose_name='Prévia da Última Mensagem'),
+        ),
+        migrations.AddField(
+            model_name='chatroom',
+            name='last_message_sender',
+            field=models.ForeignKey(blank=True, help_text='Usuário que enviou a última mensagem da sala', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Remetente da Última Mensagem'),
+        ),
+        migrations.AddField(
+            model_name='chatroom',
+            name='last_message_type',
+            field=models.CharField(blank=True, choices=[('TEXT', 'Texto'), ('IMAGE', 'Imagem'), ('FILE', 'Arquivo'), ('SYSTEM', 'Sistema')], help_text='Tipo da última mensagem enviada na sala', max_length=20, null=True, verbose_name='Tipo da Última Mensagem'),
+        ),
+        migrations.RunPython(backfill_last_message, migrations.RunPython.noop),
+    ]
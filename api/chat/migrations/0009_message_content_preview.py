@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:52
+# Editado manualmente para preencher a prévia das mensagens existentes
+
+from django.db import migrations, models
+from django.db.models.functions import Substr
+
+
+def backfill_content_preview(apps, schema_editor):
+    """Preenche content_preview com os primeiros 255 caracteres de content."""
+    Message = apps.get_model('chat', 'Message')
+    Message.objects.update(content_preview=Substr('content', 1, 255))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0008_chatroom_last_message_fields'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='message',
+            name='content_preview',
+            field=models.CharField(blank=True, default='', help_text='Início do conteúdo, usado em listagens (preenchido automaticamente)', max_length=255, verbose_name='Prévia do Conteúdo'),
+        ),
+        migrations.RunPython(backfill_content_preview, migrations.RunPython.noop),
+    ]
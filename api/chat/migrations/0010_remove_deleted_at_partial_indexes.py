@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:38
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0009_message_content_preview'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='chatroom',
+            name='chatroom_deleted_at_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='message',
+            name='message_deleted_at_idx',
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0010_remove_deleted_at_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='chatroom',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, help_text='Data e hora em que o registro foi deletado. NULL significa que está ativo.', null=True, verbose_name='Data de Exclusão'),
+        ),
+        migrations.AlterField(
+            model_name='message',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, help_text='Data e hora em que o registro foi deletado. NULL significa que está ativo.', null=True, verbose_name='Data de Exclusão'),
+        ),
+    ]
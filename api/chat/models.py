@@ -1,11 +1,58 @@
 """
 Models para o app chat (salas de chat e mensagens).
 """
-from django.db import models
+
+from django.db import models, transaction
+from django.db.models import Case, Q, Value, When
 from django.utils import timezone
 from api.utils.models import SoftDeleteMixin
+from api.utils.managers import SoftDeleteManager, SoftDeleteQuerySet
+from api.chat import cache as unread_cache
 from api.chat.enums import MessageType
 
+# Valores dos tipos de mensagem resolvidos uma única vez no import
+_TYPE_TEXT = MessageType.TEXT.value
+_TYPE_IMAGE = MessageType.IMAGE.value
+_TYPE_FILE = MessageType.FILE.value
+_TYPE_SYSTEM = MessageType.SYSTEM.value
+
+# Tamanho dos lotes de INSERT em Message.bulk_send
+BULK_SEND_BATCH_SIZE = 500
+
+# Tamanho da prévia da última mensagem guardada na sala
+LAST_MESSAGE_PREVIEW_LENGTH = 200
+
+# Tamanho da prévia do conteúdo guardada em cada mensagem
+MESSAGE_CONTENT_PREVIEW_LENGTH = 255
+
+# Campos cuja alteração em lote pode mudar o contador de não lidas
+_UNREAD_COUNT_FIELDS = frozenset({'is_read', 'deleted_at', 'room', 'room_id', 'recipient', 'recipient_id'})
+
+
+class ChatRoomQuerySet(SoftDeleteQuerySet):
+    """QuerySet de salas de chat."""
+
+    def with_participants(self):
+        """Carrega pedido, cliente e prestador no mesmo SELECT (evita N+1)."""
+        return self.select_related('order', 'client', 'provider')
+
+    def by_recent_activity(self):
+        """
+        Ordena pela última mensagem (mais recentes primeiro), desempatando
+        pela criação. Mesma ordem dos índices *_lastmsg_idx.
+        """
+        return self.order_by('-last_message_at', '-created_at')
+
+
+class ChatRoomManager(SoftDeleteManager.from_queryset(ChatRoomQuerySet)):  # type: ignore[misc]
+    """Manager padrão de ChatRoom: exclui deletadas e expõe os métodos de ChatRoomQuerySet."""
+
+    def get_queryset(self):
+        """Retorna queryset filtrando registros deletados."""
+        return ChatRoomQuerySet(self.model, using=self._db).filter(
+            deleted_at__isnull=True
+        )
+
 
 class ChatRoom(SoftDeleteMixin, models.Model):
     """
@@ -54,16 +101,56 @@ class ChatRoom(SoftDeleteMixin, models.Model):
         help_text='Data e hora da última mensagem enviada na sala'
     )
 
+    # Dados desnormalizados da última mensagem: a listagem de salas mostra a
+    # prévia sem precisar buscar a mensagem mais recente de cada sala.
+    last_message_preview = models.CharField(  # type: ignore
+        max_length=LAST_MESSAGE_PREVIEW_LENGTH,
+        blank=True,
+        null=True,
+        verbose_name='Prévia da Última Mensagem',
+        help_text='Início do conteúdo da última mensagem enviada na sala'
+    )
+
+    last_message_sender = models.ForeignKey(  # type: ignore
+        'accounts.User',
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name='+',
+        verbose_name='Remetente da Última Mensagem',
+        help_text='Usuário que enviou a última mensagem da sala'
+    )
+
+    last_message_type = models.CharField(  # type: ignore
+        max_length=20,
+        choices=MessageType.choices(),
+        blank=True,
+        null=True,
+        verbose_name='Tipo da Última Mensagem',
+        help_text='Tipo da última mensagem enviada na sala'
+    )
+
+    objects = ChatRoomManager()
+
     class Meta:
         verbose_name = 'Sala de Chat'
         verbose_name_plural = 'Salas de Chat'
-        ordering = ['-last_message_at', '-created_at']
+        # Sem ordenação padrão: COUNT/EXISTS/UPDATE não precisam de ORDER BY.
+        # Listagens ordenam explicitamente com by_recent_activity().
+        ordering = []
         indexes = [
             models.Index(fields=['order'], name='chatroom_order_idx'),
-            models.Index(fields=['client'], name='chatroom_client_idx'),
-            models.Index(fields=['provider'], name='chatroom_provider_idx'),
-            models.Index(fields=['last_message_at'], name='chatroom_last_message_at_idx'),
-            models.Index(fields=['deleted_at'], name='chatroom_deleted_at_idx'),
+            # Listagem das salas de um participante na ordem de by_recent_activity()
+            models.Index(
+                fields=['client', '-last_message_at', '-created_at'],
+                name='chatroom_client_lastmsg_idx',
+                condition=Q(deleted_at__isnull=True),
+            ),
+            models.Index(
+                fields=['provider', '-last_message_at', '-created_at'],
+                name='chatroom_provider_lastmsg_idx',
+                condition=Q(deleted_at__isnull=True),
+            ),
         ]
         # Índice único: (order, client, provider)
         constraints = [
@@ -74,12 +161,169 @@ class ChatRoom(SoftDeleteMixin, models.Model):
         ]
 
     def __str__(self):
-        return f"Chat #{self.id} - Pedido #{self.order.id} ({self.client.email} <-> {self.provider.email})"
+        # Usa apenas os IDs das FKs: listar/logar salas não dispara consultas
+        return f"Chat #{self.pk} - Pedido #{self.order_id}"
+
+    def describe(self):
+        """
+        Descrição com os e-mails dos participantes.
+
+        Acessa `client` e `provider`: use com `select_related('client', 'provider')`.
+        """
+        return f"Chat #{self.pk} - Pedido #{self.order_id} ({self.client.email} <-> {self.provider.email})"
+
+    def delete_with_messages(self):
+        """
+        Soft delete da sala e das mensagens ainda vivas dela.
+
+        `delete()` não propaga (ver docs/modelos_relacionamentos.md); use este
+        método quando as mensagens também devem sair. Elas são marcadas com
+        um único UPDATE (mesmo deleted_at da sala), sem carregar nem salvar
+        cada uma.
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            # Os destinatários são os participantes: descarta os contadores
+            # sem consultar os pares (sala, destinatário) das mensagens
+            Message.objects.filter(room=self)._update_and_invalidate(
+                self.get_unread_count_keys(), deleted_at=now
+            )
+            self.deleted_at = now
+            self.save(update_fields=['deleted_at'])
+
+    def hard_delete(self, using=None, keep_parents=False):
+        """Hard delete; as mensagens saem em cascata, junto com os contadores de não lidas."""
+        keys = self.get_unread_count_keys()
+        result = super().hard_delete(using=using, keep_parents=keep_parents)
+        unread_cache.invalidate_unread_counts(keys)
+        return result
+
+    def get_unread_count_keys(self):
+        """Pares (sala, destinatário) dos contadores de não lidas da sala."""
+        return [(self.pk, self.client_id), (self.pk, self.provider_id)]
+
+    def update_last_message_at(self, message=None, now=None):
+        """
+        Atualiza o timestamp da última mensagem e, se `message` for informada,
+        também a prévia, o remetente e o tipo dela.
+
+        Usa um UPDATE direto em vez de `save()`: roda a cada mensagem enviada
+        e não precisa de sinais nem da instância recarregada.
+
+        Args:
+            message: Última mensagem enviada na sala (opcional)
+            now: Timestamp já obtido pelo chamador, usado quando não há
+                `message` (evita um novo timezone.now() em operações em lote)
+        """
+        if message is None:
+            values = {'last_message_at': now or timezone.now()}
+        else:
+            values = self.get_last_message_values(message)
+        type(self).all_objects.filter(pk=self.pk).update(**values)
+        for attname, value in values.items():
+            setattr(self, attname, value)
+
+    @staticmethod
+    def get_last_message_values(message):
+        """Valores dos campos de última mensagem da sala para `message`."""
+        return {
+            'last_message_at': message.created_at,
+            'last_message_preview': message.content[:LAST_MESSAGE_PREVIEW_LENGTH],
+            'last_message_sender_id': message.sender_id,
+            'last_message_type': message.message_type,
+        }
+
+
+class MessageQuerySet(SoftDeleteQuerySet):
+    """QuerySet de mensagens com filtros por tipo aplicados no banco."""
+
+    def text(self):
+        """Retorna apenas mensagens de texto."""
+        return self.filter(message_type=_TYPE_TEXT)
+
+    def images(self):
+        """Retorna apenas mensagens de imagem."""
+        return self.filter(message_type=_TYPE_IMAGE)
+
+    def files(self):
+        """Retorna apenas mensagens de arquivo."""
+        return self.filter(message_type=_TYPE_FILE)
+
+    def system(self):
+        """Retorna apenas mensagens do sistema."""
+        return self.filter(message_type=_TYPE_SYSTEM)
+
+    def with_sender(self):
+        """Carrega remetente e sala no mesmo SELECT (evita N+1)."""
+        return self.select_related('sender', 'room')
+
+    def chronological(self):
+        """Ordena as mensagens da mais antiga para a mais recente."""
+        return self.order_by('created_at')
 
-    def update_last_message_at(self):
-        """Atualiza o timestamp da última mensagem."""
-        self.last_message_at = timezone.now()
-        self.save(update_fields=['last_message_at'])
+    def for_listing(self):
+        """
+        Carrega apenas as colunas usadas em listagens de mensagens.
+
+        `content` (TextField, possivelmente armazenado fora da linha via TOAST
+        no PostgreSQL) é substituído por `content_preview`.
+        """
+        return self.only(
+            'id', 'room', 'sender', 'recipient', 'content_preview',
+            'message_type', 'is_read', 'created_at',
+        )
+
+    def unread_for(self, recipient):
+        """Retorna as mensagens não lidas destinadas a `recipient`."""
+        return self.filter(recipient_id=recipient.pk, is_read=False)
+
+    def update(self, **kwargs):
+        """
+        UPDATE em lote que descarta os contadores de não lidas afetados.
+
+        Cobre também delete() e restore() do queryset. Quando a alteração
+        pode mudar algum contador, os pares (sala, destinatário) das linhas
+        atingidas são consultados antes do UPDATE (uma consulta a mais).
+        """
+        if _UNREAD_COUNT_FIELDS.isdisjoint(kwargs):
+            return super().update(**kwargs)
+        return self._update_and_invalidate(self._unread_count_keys(), **kwargs)
+
+    def hard_delete(self):
+        """Remove fisicamente as mensagens e descarta os contadores de não lidas afetados."""
+        keys = self._unread_count_keys()
+        result = super().hard_delete()
+        unread_cache.invalidate_unread_counts(keys)
+        return result
+
+    def _update_and_invalidate(self, keys, **kwargs):
+        """UPDATE em lote que descarta os contadores `keys` já conhecidos pelo chamador."""
+        updated = super().update(**kwargs)
+        if updated:
+            unread_cache.invalidate_unread_counts(keys)
+        return updated
+
+    def _unread_count_keys(self):
+        """Pares (sala, destinatário) das mensagens do queryset."""
+        return set(self.order_by().values_list('room_id', 'recipient_id').distinct())
+
+
+class MessageManager(SoftDeleteManager.from_queryset(MessageQuerySet)):  # type: ignore[misc]
+    """Manager padrão de Message: exclui deletadas e expõe os filtros de MessageQuerySet."""
+
+    def get_queryset(self):
+        """Retorna queryset filtrando registros deletados."""
+        return MessageQuerySet(self.model, using=self._db).filter(
+            deleted_at__isnull=True
+        )
+
+
+class DeletedMessageManager(models.Manager.from_queryset(MessageQuerySet)):  # type: ignore[misc]
+    """Manager de mensagens deletadas, com os métodos de MessageQuerySet."""
+
+    def get_queryset(self):
+        """Retorna queryset apenas com registros deletados."""
+        return super().get_queryset().filter(deleted_at__isnull=False)
 
 
 class Message(SoftDeleteMixin, models.Model):
@@ -103,11 +347,30 @@ class Message(SoftDeleteMixin, models.Model):
         help_text='Usuário que enviou a mensagem'
     )
 
+    # Desnormalizado a partir da sala: o outro participante da conversa.
+    # Permite contar não lidas por igualdade (recipient, is_read).
+    recipient = models.ForeignKey(  # type: ignore
+        'accounts.User',
+        on_delete=models.CASCADE,
+        related_name='received_messages',
+        blank=True,
+        verbose_name='Destinatário',
+        help_text='Participante da sala que recebe a mensagem (preenchido automaticamente)'
+    )
+
     content = models.TextField(  # type: ignore
         verbose_name='Conteúdo',
         help_text='Conteúdo da mensagem'
     )
 
+    content_preview = models.CharField(  # type: ignore
+        max_length=MESSAGE_CONTENT_PREVIEW_LENGTH,
+        blank=True,
+        default='',
+        verbose_name='Prévia do Conteúdo',
+        help_text='Início do conteúdo, usado em listagens (preenchido automaticamente)'
+    )
+
     message_type = models.CharField(  # type: ignore
         max_length=20,
         choices=MessageType.choices(),
@@ -140,44 +403,227 @@ class Message(SoftDeleteMixin, models.Model):
         verbose_name='Data de Atualização'
     )
 
+    objects = MessageManager()
+    # Também com MessageQuerySet: escritas em lote por eles mantêm o cache
+    # de não lidas
+    all_objects = models.Manager.from_queryset(MessageQuerySet)()
+    deleted_objects = DeletedMessageManager()
+
     class Meta:
         verbose_name = 'Mensagem'
         verbose_name_plural = 'Mensagens'
-        ordering = ['created_at']
+        # Sem ordenação padrão: COUNT/EXISTS/UPDATE não precisam de ORDER BY.
+        # Leituras da conversa ordenam explicitamente com chronological().
+        ordering = []
         indexes = [
-            models.Index(fields=['room'], name='message_room_idx'),
             models.Index(fields=['sender'], name='message_sender_idx'),
-            models.Index(fields=['created_at'], name='message_created_at_idx'),
-            models.Index(fields=['is_read'], name='message_is_read_idx'),
-            models.Index(fields=['deleted_at'], name='message_deleted_at_idx'),
+            # Mensagens não deletadas de uma sala em ordem cronológica. As colunas
+            # leves da listagem vão no INCLUDE (PostgreSQL) para permitir
+            # Index Only Scan; `content` fica de fora por ser largo.
+            models.Index(
+                fields=['room', 'created_at'],
+                name='message_room_created_cover_idx',
+                include=['sender', 'message_type', 'is_read'],
+                condition=Q(deleted_at__isnull=True),
+            ),
+            # Contagem de não lidas de uma sala (remetente = outro participante)
+            models.Index(
+                fields=['room', 'is_read', 'sender'],
+                name='message_room_unread_idx',
+                condition=Q(is_read=False, deleted_at__isnull=True),
+            ),
+            # Mensagens não lidas de um usuário (badge de não lidas)
+            models.Index(
+                fields=['recipient', 'is_read'],
+                name='message_recipient_unread_idx',
+                condition=Q(is_read=False, deleted_at__isnull=True),
+            ),
         ]
 
     def __str__(self):
-        return f"Mensagem #{self.id} de {self.sender.email} em Chat #{self.room.id}"
+        # Usa apenas os IDs das FKs: listar/logar mensagens não dispara consultas
+        return f"Mensagem #{self.pk} de Usuário #{self.sender_id} em Chat #{self.room_id}"
+
+    def as_log_line(self):
+        """
+        Linha de log com o e-mail do remetente.
+
+        Acessa `sender`: use com `select_related('sender')`.
+        """
+        return f"Mensagem #{self.pk} de {self.sender.email} em Chat #{self.room_id}"
 
-    def mark_as_read(self):
-        """Marca a mensagem como lida."""
+    def save(self, *args, **kwargs):
+        """
+        Preenche o destinatário a partir da sala, se não informado, e mantém
+        o contador de não lidas em cache (ver `api.chat.cache`).
+        """
+        if self.recipient_id is None and self.room_id is not None:
+            self.recipient_id = self.get_recipient_id(self.room, self.sender_id)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None:
+            self.content_preview = self.get_content_preview(self.content)
+        elif 'content' in update_fields:
+            self.content_preview = self.get_content_preview(self.content)
+            kwargs['update_fields'] = {*update_fields, 'content_preview'}
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+
+        # Envio não lido, leitura, soft delete, restore...: recalcula na
+        # próxima consulta
+        if not (adding and self.is_read):
+            unread_cache.invalidate_unread_count(self.room_id, self.recipient_id)
+
+    def hard_delete(self, using=None, keep_parents=False):
+        """Hard delete que descarta o contador de não lidas do destinatário."""
+        room_id, recipient_id = self.room_id, self.recipient_id
+        result = super().hard_delete(using=using, keep_parents=keep_parents)
+        unread_cache.invalidate_unread_count(room_id, recipient_id)
+        return result
+
+    @staticmethod
+    def get_content_preview(content):
+        """Retorna o início do conteúdo usado como prévia."""
+        return (content or '')[:MESSAGE_CONTENT_PREVIEW_LENGTH]
+
+    @staticmethod
+    def get_recipient_id(room, sender_id):
+        """Retorna o ID do outro participante da sala em relação a `sender_id`."""
+        if sender_id == room.client_id:
+            return room.provider_id
+        return room.client_id
+
+    @classmethod
+    def bulk_send(cls, messages):
+        """
+        Cria várias mensagens de uma vez (ex.: avisos do sistema, importações).
+
+        Em vez de um INSERT + um UPDATE da sala por mensagem, faz INSERTs em
+        lotes e um único UPDATE de `last_message_at` para todas as salas
+        envolvidas. `bulk_create` não chama `save()` nem dispara sinais, então
+        o destinatário (com uma consulta às salas) e a prévia do conteúdo são
+        preenchidos aqui.
+
+        Args:
+            messages: Instâncias de Message ainda não salvas
+
+        Returns:
+            list[Message]: As mensagens criadas
+
+        Raises:
+            ValueError: Se alguma mensagem aponta para uma sala inexistente ou deletada
+        """
+        messages = list(messages)
+        if not messages:
+            return []
+
+        for message in messages:
+            message.content_preview = cls.get_content_preview(message.content)
+
+        room_ids = {m.room_id for m in messages}
+        rooms = ChatRoom.objects.only('client', 'provider').in_bulk(room_ids)
+        invalid_room_ids = room_ids - rooms.keys()
+        if invalid_room_ids:
+            raise ValueError(
+                f'Salas de chat inexistentes ou deletadas: {", ".join(map(str, sorted(invalid_room_ids, key=str)))}'
+            )
+        for message in messages:
+            if message.recipient_id is None:
+                message.recipient_id = cls.get_recipient_id(rooms[message.room_id], message.sender_id)
+
+        with transaction.atomic():
+            created = cls.objects.bulk_create(messages, batch_size=BULK_SEND_BATCH_SIZE)
+            cls._update_rooms_last_message(created)
+
+        unread_cache.invalidate_unread_counts((m.room_id, m.recipient_id) for m in created if not m.is_read)
+        return created
+
+    @staticmethod
+    def _update_rooms_last_message(messages):
+        """
+        Grava a última mensagem de cada sala com um único UPDATE.
+
+        Cada coluna recebe um CASE por sala com os valores da última
+        mensagem dela no lote.
+        """
+        values_by_room = {
+            room_id: ChatRoom.get_last_message_values(message)
+            for room_id, message in {m.room_id: m for m in messages}.items()
+        }
+        updates = {}
+        for attname in ChatRoom.get_last_message_values(messages[-1]):
+            output_field = ChatRoom._meta.get_field(attname)
+            updates[attname] = Case(
+                *[
+                    When(pk=room_id, then=Value(values[attname], output_field=output_field))
+                    for room_id, values in values_by_room.items()
+                ],
+                output_field=output_field,
+            )
+        ChatRoom.all_objects.filter(pk__in=values_by_room).update(**updates)
+
+    def mark_as_read(self, now=None):
+        """Marca a mensagem como lida (em `now`, se informado)."""
         if not self.is_read:
             self.is_read = True
-            self.read_at = timezone.now()
+            self.read_at = now or timezone.now()
             self.save(update_fields=['is_read', 'read_at'])
 
+    @classmethod
+    def mark_room_as_read(cls, room, recipient, now=None):
+        """
+        Marca como lidas, com um único UPDATE, todas as mensagens não lidas
+        da sala destinadas a `recipient`.
+
+        Use no lugar de `mark_as_read()` em loop ao abrir uma conversa.
+
+        Args:
+            room: Sala de chat
+            recipient: Usuário que está lendo a conversa
+            now: Timestamp de leitura já obtido pelo chamador (opcional)
+
+        Returns:
+            int: Quantidade de mensagens marcadas como lidas
+        """
+        # Troca a geração em vez de gravar 0: não sobrescreve um envio concorrente
+        return cls.objects.unread_for(recipient).filter(
+            room_id=room.pk,
+        )._update_and_invalidate(
+            [(room.pk, recipient.pk)], is_read=True, read_at=now or timezone.now()
+        )
+
+    @classmethod
+    def get_unread_count(cls, room, recipient):
+        """
+        Retorna quantas mensagens da sala `recipient` ainda não leu.
+
+        Servido pelo cache; em caso de ausência, calcula com um COUNT e grava
+        a entrada após o commit da transação atual. A geração é lida antes do
+        COUNT: se uma escrita a trocar nesse meio-tempo, o valor calculado
+        não é servido a ninguém.
+        """
+        generation = unread_cache.get_unread_count_generation(room.pk, recipient.pk)
+        count = unread_cache.get_cached_unread_count(room.pk, recipient.pk, generation)
+        if count is None:
+            count = cls.objects.unread_for(recipient).filter(room_id=room.pk).count()
+            unread_cache.add_unread_count(room.pk, recipient.pk, generation, count)
+        return count
+
     @property
     def is_text(self):
         """Retorna True se a mensagem é do tipo texto."""
-        return self.message_type == MessageType.TEXT.value
+        return self.message_type == _TYPE_TEXT
 
     @property
     def is_image(self):
         """Retorna True se a mensagem é do tipo imagem."""
-        return self.message_type == MessageType.IMAGE.value
+        return self.message_type == _TYPE_IMAGE
 
     @property
     def is_file(self):
         """Retorna True se a mensagem é do tipo arquivo."""
-        return self.message_type == MessageType.FILE.value
+        return self.message_type == _TYPE_FILE
 
     @property
     def is_system(self):
         """Retorna True se a mensagem é do tipo sistema."""
-        return self.message_type == MessageType.SYSTEM.value
+        return self.message_type == _TYPE_SYSTEM
@@ -1,11 +1,14 @@
 """
 Testes unitários para o app chat.
 """
+import copy
+from unittest import mock
+
 from django.test import TestCase
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 from django.utils import timezone
-import time
 from datetime import timedelta
 from api.chat.models import ChatRoom, Message
 from api.chat.enums import MessageType
@@ -17,59 +20,104 @@ from api.services.models import ServiceCategory, Service
 from decimal import Decimal
 
 
-class ChatRoomModelTestCase(TestCase):
-    """Testes unitários para o modelo ChatRoom."""
+class ChatFixtureMixin:
+    """Mixin com os dados comuns aos testes do chat (usuários, serviço e pedido)."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Cria dados de teste."""
-        # Cria usuário cliente
-        self.client_user = User.objects.create_user(  # type: ignore[call-arg]
+        # Cria usuários cliente e prestador em um único INSERT. Nenhum teste
+        # faz login, então a senha fica inutilizável (sem custo de hash).
+        cls.client_user = User(
             email='client@example.com',
+            username='client@example.com',
             first_name='Client',
             last_name='User',
-            password='testpass123',
             user_type=UserType.CLIENT.value
         )
-        self.client_profile = ClientProfile.objects.create(user=self.client_user)
-
-        # Cria usuário prestador
-        self.provider_user = User.objects.create_user(  # type: ignore[call-arg]
+        cls.provider_user = User(
             email='provider@example.com',
+            username='provider@example.com',
             first_name='Provider',
             last_name='User',
-            password='testpass123',
             user_type=UserType.PROVIDER.value
         )
-        self.provider_profile = ProviderProfile.objects.create(user=self.provider_user)
+        for user in (cls.client_user, cls.provider_user):
+            user.set_unusable_password()
+        User.objects.bulk_create([cls.client_user, cls.provider_user])
+
+        # Perfis (tabelas diferentes: um INSERT cada)
+        cls.client_profile = ClientProfile.objects.create(user=cls.client_user)
+        cls.provider_profile = ProviderProfile.objects.create(user=cls.provider_user)
 
         # Cria categoria e serviço
-        self.category = ServiceCategory.objects.create(name='Desenvolvimento Web')
-        self.service = Service.objects.create(
-            category=self.category,
+        cls.category = ServiceCategory.objects.create(name='Desenvolvimento Web')
+        cls.service = Service.objects.create(
+            category=cls.category,
             name='Desenvolvimento de Site'
         )
 
         # Cria pedido
-        self.future_deadline = timezone.now() + timedelta(days=30)
-        self.order = Order.objects.create(
-            client=self.client_profile,
-            service=self.service,
+        cls.future_deadline = timezone.now() + timedelta(days=30)
+        cls.order = Order.objects.create(
+            client=cls.client_profile,
+            service=cls.service,
             title='Desenvolvimento de E-commerce',
             description='Preciso de um e-commerce completo',
             budget_min=Decimal('5000.00'),
             budget_max=Decimal('10000.00'),
-            deadline=self.future_deadline
+            deadline=cls.future_deadline
+        )
+
+
+class ChatRoomModelTestCase(ChatFixtureMixin, TestCase):
+    """Testes unitários para o modelo ChatRoom."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Cria dados de teste."""
+        super().setUpTestData()
+
+        # Segundo cliente, prestador e pedido, para testes com mais de uma sala.
+        # Nenhum teste cria objetos que apontem para perfis deles.
+        cls.client_user2 = User(
+            email='client2@example.com',
+            username='client2@example.com',
+            first_name='Client2',
+            last_name='User',
+            user_type=UserType.CLIENT.value
+        )
+        cls.provider_user2 = User(
+            email='provider2@example.com',
+            username='provider2@example.com',
+            first_name='Provider2',
+            last_name='User',
+            user_type=UserType.PROVIDER.value
+        )
+        for user in (cls.client_user2, cls.provider_user2):
+            user.set_unusable_password()
+        User.objects.bulk_create([cls.client_user2, cls.provider_user2])
+
+        cls.order2 = Order.objects.create(
+            client=cls.client_profile,
+            service=cls.service,
+            title='Outro Pedido',
+            description='Outra descrição',
+            budget_min=Decimal('3000.00'),
+            budget_max=Decimal('5000.00'),
+            deadline=cls.future_deadline
         )
 
     def test_create_chatroom_with_all_fields(self):
         """Testa criação de sala de chat com todos os campos."""
         last_message_at = timezone.now()
-        chatroom = ChatRoom.objects.create(
-            order=self.order,
-            client=self.client_user,
-            provider=self.provider_user,
-            last_message_at=last_message_at
-        )
+        with self.assertNumQueries(1):
+            chatroom = ChatRoom.objects.create(
+                order=self.order,
+                client=self.client_user,
+                provider=self.provider_user,
+                last_message_at=last_message_at
+            )
 
         self.assertEqual(chatroom.order, self.order)
         self.assertEqual(chatroom.client, self.client_user)
@@ -79,30 +127,13 @@ class ChatRoomModelTestCase(TestCase):
         self.assertIsNotNone(chatroom.updated_at)
         self.assertIsNone(chatroom.deleted_at)
 
-    def test_create_chatroom_without_last_message_at(self):
-        """Testa criação de sala de chat sem last_message_at."""
-        chatroom = ChatRoom.objects.create(
-            order=self.order,
-            client=self.client_user,
-            provider=self.provider_user,
-            last_message_at=None
-        )
-
-        self.assertIsNone(chatroom.last_message_at)
-        self.assertIsNotNone(chatroom.created_at)
+        # last_message_at é opcional: validar o campo não precisa de banco
+        other_fields = [f.name for f in ChatRoom._meta.fields if f.name != 'last_message_at']
+        ChatRoom(last_message_at=None).clean_fields(exclude=other_fields)
+        self.assertTrue(ChatRoom._meta.get_field('last_message_at').null)
 
     def test_order_foreign_key_relationship(self):
         """Testa relacionamento ForeignKey com Order."""
-        # Cria outro prestador para poder criar segunda sala
-        provider_user2 = User.objects.create_user(  # type: ignore[call-arg]
-            email='provider2@example.com',
-            first_name='Provider2',
-            last_name='User',
-            password='testpass123',
-            user_type=UserType.PROVIDER.value
-        )
-        ProviderProfile.objects.create(user=provider_user2)
-
         chatroom1 = ChatRoom.objects.create(
             order=self.order,
             client=self.client_user,
@@ -111,39 +142,27 @@ class ChatRoomModelTestCase(TestCase):
         chatroom2 = ChatRoom.objects.create(
             order=self.order,
             client=self.client_user,
-            provider=provider_user2
+            provider=self.provider_user2
         )
 
         # Verifica relacionamento direto
         self.assertEqual(chatroom1.order, self.order)
         self.assertEqual(chatroom2.order, self.order)
 
-        # Verifica relacionamento reverso
-        chatrooms = self.order.chat_rooms.all()
-        self.assertEqual(chatrooms.count(), 2)
-        self.assertIn(chatroom1, chatrooms)
-        self.assertIn(chatroom2, chatrooms)
+        # Verifica relacionamento reverso (uma consulta só)
+        with self.assertNumQueries(1):
+            chatrooms = list(self.order.chat_rooms.all())
+        self.assertEqual({c.pk for c in chatrooms}, {chatroom1.pk, chatroom2.pk})
 
     def test_client_foreign_key_relationship(self):
         """Testa relacionamento ForeignKey com User (client)."""
-        # Cria outro pedido para poder criar segunda sala
-        order2 = Order.objects.create(
-            client=self.client_profile,
-            service=self.service,
-            title='Outro Pedido',
-            description='Outra descrição',
-            budget_min=Decimal('3000.00'),
-            budget_max=Decimal('5000.00'),
-            deadline=self.future_deadline
-        )
-
         chatroom1 = ChatRoom.objects.create(
             order=self.order,
             client=self.client_user,
             provider=self.provider_user
         )
         chatroom2 = ChatRoom.objects.create(
-            order=order2,
+            order=self.order2,
             client=self.client_user,
             provider=self.provider_user
         )
@@ -152,24 +171,13 @@ class ChatRoomModelTestCase(TestCase):
         self.assertEqual(chatroom1.client, self.client_user)
         self.assertEqual(chatroom2.client, self.client_user)
 
-        # Verifica relacionamento reverso
-        chatrooms = self.client_user.client_chat_rooms.all()
-        self.assertEqual(chatrooms.count(), 2)
-        self.assertIn(chatroom1, chatrooms)
-        self.assertIn(chatroom2, chatrooms)
+        # Verifica relacionamento reverso (uma consulta só)
+        with self.assertNumQueries(1):
+            chatrooms = list(self.client_user.client_chat_rooms.all())
+        self.assertEqual({c.pk for c in chatrooms}, {chatroom1.pk, chatroom2.pk})
 
     def test_provider_foreign_key_relationship(self):
         """Testa relacionamento ForeignKey com User (provider)."""
-        # Cria outro cliente para poder criar segunda sala
-        client_user2 = User.objects.create_user(  # type: ignore[call-arg]
-            email='client2@example.com',
-            first_name='Client2',
-            last_name='User',
-            password='testpass123',
-            user_type=UserType.CLIENT.value
-        )
-        ClientProfile.objects.create(user=client_user2)
-
         chatroom1 = ChatRoom.objects.create(
             order=self.order,
             client=self.client_user,
@@ -177,7 +185,7 @@ class ChatRoomModelTestCase(TestCase):
         )
         chatroom2 = ChatRoom.objects.create(
             order=self.order,
-            client=client_user2,
+            client=self.client_user2,
             provider=self.provider_user
         )
 
@@ -185,11 +193,10 @@ class ChatRoomModelTestCase(TestCase):
         self.assertEqual(chatroom1.provider, self.provider_user)
         self.assertEqual(chatroom2.provider, self.provider_user)
 
-        # Verifica relacionamento reverso
-        chatrooms = self.provider_user.provider_chat_rooms.all()
-        self.assertEqual(chatrooms.count(), 2)
-        self.assertIn(chatroom1, chatrooms)
-        self.assertIn(chatroom2, chatrooms)
+        # Verifica relacionamento reverso (uma consulta só)
+        with self.assertNumQueries(1):
+            chatrooms = list(self.provider_user.provider_chat_rooms.all())
+        self.assertEqual({c.pk for c in chatrooms}, {chatroom1.pk, chatroom2.pk})
 
     def test_unique_constraint_order_client_provider(self):
         """Testa constraint único: (order, client, provider)."""
@@ -210,37 +217,6 @@ class ChatRoomModelTestCase(TestCase):
 
     def test_unique_constraint_allows_different_combinations(self):
         """Testa que constraint único permite combinações diferentes."""
-        # Cria outro cliente
-        client_user2 = User.objects.create_user(  # type: ignore[call-arg]
-            email='client2@example.com',
-            first_name='Client2',
-            last_name='User',
-            password='testpass123',
-            user_type=UserType.CLIENT.value
-        )
-        ClientProfile.objects.create(user=client_user2)
-
-        # Cria outro prestador
-        provider_user2 = User.objects.create_user(  # type: ignore[call-arg]
-            email='provider2@example.com',
-            first_name='Provider2',
-            last_name='User',
-            password='testpass123',
-            user_type=UserType.PROVIDER.value
-        )
-        ProviderProfile.objects.create(user=provider_user2)
-
-        # Cria outra ordem
-        order2 = Order.objects.create(
-            client=self.client_profile,
-            service=self.service,
-            title='Outro Pedido',
-            description='Outra descrição',
-            budget_min=Decimal('3000.00'),
-            budget_max=Decimal('5000.00'),
-            deadline=self.future_deadline
-        )
-
         # Todas essas combinações devem ser permitidas
         ChatRoom.objects.create(
             order=self.order,
@@ -250,18 +226,18 @@ class ChatRoomModelTestCase(TestCase):
 
         ChatRoom.objects.create(
             order=self.order,
-            client=client_user2,
+            client=self.client_user2,
             provider=self.provider_user
         )
 
         ChatRoom.objects.create(
             order=self.order,
             client=self.client_user,
-            provider=provider_user2
+            provider=self.provider_user2
         )
 
         ChatRoom.objects.create(
-            order=order2,
+            order=self.order2,
             client=self.client_user,
             provider=self.provider_user
         )
@@ -275,22 +251,45 @@ class ChatRoomModelTestCase(TestCase):
             client=self.client_user,
             provider=self.provider_user
         )
-        expected = f"Chat #{chatroom.id} - Pedido #{self.order.id} ({self.client_user.email} <-> {self.provider_user.email})"
-        self.assertEqual(str(chatroom), expected)
+        with self.assertNumQueries(0):
+            self.assertEqual(str(chatroom), f"Chat #{chatroom.id} - Pedido #{self.order.id}")
 
-    def test_created_at_auto_now_add(self):
-        """Testa que created_at é preenchido automaticamente."""
-        before = timezone.now()
+    def test_describe_includes_participant_emails(self):
+        """Testa que describe inclui os e-mails dos participantes."""
         chatroom = ChatRoom.objects.create(
             order=self.order,
             client=self.client_user,
             provider=self.provider_user
         )
-        after = timezone.now()
+        chatroom = ChatRoom.objects.select_related('client', 'provider').get(pk=chatroom.pk)
+        expected = f"Chat #{chatroom.id} - Pedido #{self.order.id} ({self.client_user.email} <-> {self.provider_user.email})"
+        with self.assertNumQueries(0):
+            self.assertEqual(chatroom.describe(), expected)
 
-        self.assertIsNotNone(chatroom.created_at)
-        self.assertGreaterEqual(chatroom.created_at, before)
-        self.assertLessEqual(chatroom.created_at, after)
+    def test_with_participants_loads_related_in_single_query(self):
+        """Testa que with_participants carrega pedido e participantes no mesmo SELECT."""
+        ChatRoom.objects.create(
+            order=self.order,
+            client=self.client_user,
+            provider=self.provider_user
+        )
+
+        with self.assertNumQueries(1):
+            descriptions = [room.describe() for room in ChatRoom.objects.with_participants()]
+        self.assertEqual(len(descriptions), 1)
+
+    def test_created_at_auto_now_add(self):
+        """Testa que created_at é preenchido automaticamente."""
+        fixed_now = timezone.now()
+        with mock.patch('django.utils.timezone.now', return_value=fixed_now):
+            chatroom = ChatRoom.objects.create(
+                order=self.order,
+                client=self.client_user,
+                provider=self.provider_user
+            )
+
+        self.assertEqual(chatroom.created_at, fixed_now)
+        self.assertEqual(chatroom.updated_at, fixed_now)
 
     def test_updated_at_auto_now(self):
         """Testa que updated_at é atualizado automaticamente."""
@@ -299,15 +298,15 @@ class ChatRoomModelTestCase(TestCase):
             client=self.client_user,
             provider=self.provider_user
         )
-        original_updated_at = chatroom.updated_at
-
-        # Aguarda um pouco para garantir diferença de tempo
-        time.sleep(0.01)
+        original_created_at = chatroom.created_at
+        later = chatroom.updated_at + timedelta(seconds=1)
 
         chatroom.last_message_at = timezone.now()
-        chatroom.save()
+        with mock.patch('django.utils.timezone.now', return_value=later):
+            chatroom.save()
 
-        self.assertGreater(chatroom.updated_at, original_updated_at)
+        self.assertEqual(chatroom.updated_at, later)
+        self.assertEqual(chatroom.created_at, original_created_at)
 
     def test_soft_delete_functionality(self):
         """Testa funcionalidade de soft delete."""
@@ -346,25 +345,8 @@ class ChatRoomModelTestCase(TestCase):
         self.assertEqual(ChatRoom.objects.count(), 1)
 
     def test_ordering_by_last_message_at_desc_then_created_at_desc(self):
-        """Testa que ordenação padrão é por last_message_at descendente, depois created_at descendente."""
-        # Cria outros usuários para poder criar múltiplas salas
-        client_user2 = User.objects.create_user(  # type: ignore[call-arg]
-            email='client2@example.com',
-            first_name='Client2',
-            last_name='User',
-            password='testpass123',
-            user_type=UserType.CLIENT.value
-        )
-        ClientProfile.objects.create(user=client_user2)
-
-        provider_user2 = User.objects.create_user(  # type: ignore[call-arg]
-            email='provider2@example.com',
-            first_name='Provider2',
-            last_name='User',
-            password='testpass123',
-            user_type=UserType.PROVIDER.value
-        )
-        ProviderProfile.objects.create(user=provider_user2)
+        """Testa que by_recent_activity ordena por last_message_at descendente, depois created_at descendente."""
+        now = timezone.now()
 
         # Sala sem last_message_at
         chatroom1 = ChatRoom.objects.create(
@@ -374,29 +356,29 @@ class ChatRoomModelTestCase(TestCase):
             last_message_at=None
         )
 
-        time.sleep(0.01)
-
         # Sala com last_message_at mais antigo
-        old_time = timezone.now() - timedelta(days=1)
+        old_time = now - timedelta(days=1)
         chatroom2 = ChatRoom.objects.create(
             order=self.order,
-            client=client_user2,
+            client=self.client_user2,
             provider=self.provider_user,
             last_message_at=old_time
         )
 
-        time.sleep(0.01)
-
         # Sala com last_message_at mais recente
-        recent_time = timezone.now()
+        recent_time = now
         chatroom3 = ChatRoom.objects.create(
             order=self.order,
             client=self.client_user,
-            provider=provider_user2,
+            provider=self.provider_user2,
             last_message_at=recent_time
         )
 
-        chatrooms = list(ChatRoom.objects.all())
+        # created_at explícito em vez de esperar o relógio avançar
+        for offset, room in enumerate([chatroom1, chatroom2, chatroom3]):
+            ChatRoom.objects.filter(pk=room.pk).update(created_at=now + timedelta(seconds=offset))
+
+        chatrooms = list(ChatRoom.objects.by_recent_activity())
 
         # chatroom3 tem last_message_at mais recente, deve aparecer primeiro
         self.assertEqual(chatrooms[0], chatroom3)
@@ -405,78 +387,34 @@ class ChatRoomModelTestCase(TestCase):
         # chatroom1 não tem last_message_at, deve aparecer por último (ordenado por created_at desc)
         self.assertEqual(chatrooms[2], chatroom1)
 
-    def test_indexes_exist(self):
-        """Testa que os índices foram criados corretamente."""
-        chatroom = ChatRoom.objects.create(
-            order=self.order,
-            client=self.client_user,
-            provider=self.provider_user
-        )
-
-        # Testa queries que usam os índices (verifica que não há erros)
-        ChatRoom.objects.filter(order=self.order).first()
-        ChatRoom.objects.filter(client=self.client_user).first()
-        ChatRoom.objects.filter(provider=self.provider_user).first()
-        ChatRoom.objects.filter(last_message_at__isnull=True).first()
-        ChatRoom.objects.filter(deleted_at__isnull=True).first()
-
-        # Verifica que os índices estão definidos no Meta
+    def test_indexes_and_constraints_defined(self):
+        """Testa que os índices e o constraint único estão definidos no Meta."""
         index_names = [idx.name for idx in ChatRoom._meta.indexes]
         self.assertIn('chatroom_order_idx', index_names)
-        self.assertIn('chatroom_client_idx', index_names)
-        self.assertIn('chatroom_provider_idx', index_names)
-        self.assertIn('chatroom_last_message_at_idx', index_names)
-        self.assertIn('chatroom_deleted_at_idx', index_names)
+        self.assertIn('chatroom_client_lastmsg_idx', index_names)
+        self.assertIn('chatroom_provider_lastmsg_idx', index_names)
 
-    def test_unique_constraint_exists(self):
-        """Testa que o constraint único está definido."""
         constraints = [c.name for c in ChatRoom._meta.constraints]
         self.assertIn('unique_chatroom_order_client_provider', constraints)
 
-    def test_cascade_delete_when_order_hard_deleted(self):
-        """Testa que salas de chat são deletadas quando pedido é hard deleted."""
-        chatroom = ChatRoom.objects.create(
-            order=self.order,
-            client=self.client_user,
-            provider=self.provider_user
-        )
-        chatroom_id = chatroom.id
-
-        # Hard delete do pedido
-        self.order.hard_delete()
-
-        # A sala também deve ser deletada (CASCADE)
-        self.assertFalse(ChatRoom.all_objects.filter(id=chatroom_id).exists())
-
-    def test_cascade_delete_when_client_hard_deleted(self):
-        """Testa que salas de chat são deletadas quando cliente é hard deleted."""
-        chatroom = ChatRoom.objects.create(
-            order=self.order,
-            client=self.client_user,
-            provider=self.provider_user
-        )
-        chatroom_id = chatroom.id
-
-        # Hard delete do cliente
-        self.client_user.hard_delete()
-
-        # A sala também deve ser deletada (CASCADE)
-        self.assertFalse(ChatRoom.all_objects.filter(id=chatroom_id).exists())
-
-    def test_cascade_delete_when_provider_hard_deleted(self):
-        """Testa que salas de chat são deletadas quando prestador é hard deleted."""
-        chatroom = ChatRoom.objects.create(
-            order=self.order,
-            client=self.client_user,
-            provider=self.provider_user
-        )
-        chatroom_id = chatroom.id
-
-        # Hard delete do prestador
-        self.provider_user.hard_delete()
-
-        # A sala também deve ser deletada (CASCADE)
-        self.assertFalse(ChatRoom.all_objects.filter(id=chatroom_id).exists())
+    def test_cascade_delete_when_related_hard_deleted(self):
+        """Testa que salas de chat são deletadas quando pedido, cliente ou prestador é hard deleted."""
+        targets = {'order': self.order, 'client': self.client_user, 'provider': self.provider_user}
+        for name, target in targets.items():
+            # Savepoint desfeito ao fim de cada caso: o próximo parte da fixture intacta
+            with self.subTest(target=name), transaction.atomic():
+                chatroom = ChatRoom.objects.create(
+                    order=self.order,
+                    client=self.client_user,
+                    provider=self.provider_user
+                )
+
+                # delete() zera o pk da instância: apaga uma cópia para não afetar os próximos casos
+                copy.copy(target).hard_delete()
+
+                # A sala também deve ser deletada (CASCADE)
+                self.assertFalse(ChatRoom.all_objects.filter(id=chatroom.id).exists())
+                transaction.set_rollback(True)
 
     def test_update_last_message_at_method(self):
         """Testa o método update_last_message_at."""
@@ -493,7 +431,6 @@ class ChatRoomModelTestCase(TestCase):
         before = timezone.now()
         chatroom.update_last_message_at()
         after = timezone.now()
-        chatroom.refresh_from_db()
 
         self.assertIsNotNone(chatroom.last_message_at)
         self.assertGreaterEqual(chatroom.last_message_at, before)
@@ -513,73 +450,97 @@ class ChatRoomModelTestCase(TestCase):
 
         # Atualiza last_message_at
         chatroom.update_last_message_at()
-        chatroom.refresh_from_db()
 
         self.assertGreater(chatroom.last_message_at, old_time)
 
+    def test_update_last_message_at_with_message_sets_preview(self):
+        """Testa que update_last_message_at(message) grava prévia, remetente e tipo."""
+        chatroom = ChatRoom.objects.create(
+            order=self.order,
+            client=self.client_user,
+            provider=self.provider_user
+        )
+        message = Message.objects.create(
+            room=chatroom,
+            sender=self.provider_user,
+            content='x' * 300,
+            message_type=MessageType.FILE.value
+        )
 
-class MessageModelTestCase(TestCase):
-    """Testes unitários para o modelo Message."""
+        with self.assertNumQueries(1):
+            chatroom.update_last_message_at(message)
+        chatroom.refresh_from_db()
 
-    def setUp(self):
-        """Cria dados de teste."""
-        # Cria usuário cliente
-        self.client_user = User.objects.create_user(  # type: ignore[call-arg]
-            email='client@example.com',
-            first_name='Client',
-            last_name='User',
-            password='testpass123',
-            user_type=UserType.CLIENT.value
-        )
-        self.client_profile = ClientProfile.objects.create(user=self.client_user)
+        self.assertEqual(chatroom.last_message_at, message.created_at)
+        self.assertEqual(chatroom.last_message_preview, 'x' * 200)
+        self.assertEqual(chatroom.last_message_sender, self.provider_user)
+        self.assertEqual(chatroom.last_message_type, MessageType.FILE.value)
 
-        # Cria usuário prestador
-        self.provider_user = User.objects.create_user(  # type: ignore[call-arg]
-            email='provider@example.com',
-            first_name='Provider',
-            last_name='User',
-            password='testpass123',
-            user_type=UserType.PROVIDER.value
+    def test_update_last_message_at_accepts_shared_timestamp(self):
+        """Testa que update_last_message_at usa o timestamp informado."""
+        chatroom = ChatRoom.objects.create(
+            order=self.order,
+            client=self.client_user,
+            provider=self.provider_user
         )
-        self.provider_profile = ProviderProfile.objects.create(user=self.provider_user)
+        now = timezone.now() - timedelta(minutes=5)
 
-        # Cria categoria e serviço
-        self.category = ServiceCategory.objects.create(name='Desenvolvimento Web')
-        self.service = Service.objects.create(
-            category=self.category,
-            name='Desenvolvimento de Site'
-        )
+        chatroom.update_last_message_at(now=now)
+        chatroom.refresh_from_db()
 
-        # Cria pedido
-        self.future_deadline = timezone.now() + timedelta(days=30)
-        self.order = Order.objects.create(
-            client=self.client_profile,
-            service=self.service,
-            title='Desenvolvimento de E-commerce',
-            description='Preciso de um e-commerce completo',
-            budget_min=Decimal('5000.00'),
-            budget_max=Decimal('10000.00'),
-            deadline=self.future_deadline
-        )
+        self.assertEqual(chatroom.last_message_at, now)
 
-        # Cria sala de chat
-        self.chatroom = ChatRoom.objects.create(
+    def test_update_last_message_at_uses_single_update(self):
+        """Testa que update_last_message_at executa apenas um UPDATE e atualiza a instância."""
+        chatroom = ChatRoom.objects.create(
             order=self.order,
             client=self.client_user,
             provider=self.provider_user
         )
 
+        with self.assertNumQueries(1):
+            chatroom.update_last_message_at()
+
+        self.assertIsNotNone(chatroom.last_message_at)
+        self.assertEqual(
+            ChatRoom.objects.get(pk=chatroom.pk).last_message_at,
+            chatroom.last_message_at
+        )
+
+
+class MessageModelTestCase(ChatFixtureMixin, TestCase):
+    """Testes unitários para o modelo Message."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Cria dados de teste."""
+        super().setUpTestData()
+
+        # Cria sala de chat
+        cls.chatroom = ChatRoom.objects.create(
+            order=cls.order,
+            client=cls.client_user,
+            provider=cls.provider_user
+        )
+
+    def setUp(self):
+        """Limpa o cache antes de cada teste."""
+        # Contadores de não lidas ficam no cache (IDs podem se repetir entre testes)
+        cache.clear()
+
     def test_create_message_with_all_fields(self):
         """Testa criação de mensagem com todos os campos."""
         read_at = timezone.now()
-        message = Message.objects.create(
-            room=self.chatroom,
-            sender=self.client_user,
-            content='Olá, como vai?',
-            message_type=MessageType.TEXT.value,
-            is_read=True,
-            read_at=read_at
-        )
+        # Destinatário vem da sala já carregada: só o INSERT
+        with self.assertNumQueries(1):
+            message = Message.objects.create(
+                room=self.chatroom,
+                sender=self.client_user,
+                content='Olá, como vai?',
+                message_type=MessageType.TEXT.value,
+                is_read=True,
+                read_at=read_at
+            )
 
         self.assertEqual(message.room, self.chatroom)
         self.assertEqual(message.sender, self.client_user)
@@ -593,7 +554,8 @@ class MessageModelTestCase(TestCase):
 
     def test_message_type_default_is_text(self):
         """Testa que message_type padrão é TEXT."""
-        message = Message.objects.create(
+        # Defaults são aplicados no __init__: não precisa salvar
+        message = Message(
             room=self.chatroom,
             sender=self.client_user,
             content='Mensagem de texto'
@@ -603,105 +565,56 @@ class MessageModelTestCase(TestCase):
 
     def test_message_type_choices(self):
         """Testa que message_type aceita apenas valores válidos."""
-        # TEXT
-        message = Message.objects.create(
-            room=self.chatroom,
-            sender=self.client_user,
-            content='Mensagem de texto',
-            message_type=MessageType.TEXT.value
-        )
-        self.assertEqual(message.message_type, MessageType.TEXT.value)
-        self.assertTrue(message.is_text)
-        self.assertFalse(message.is_image)
-        self.assertFalse(message.is_file)
-        self.assertFalse(message.is_system)
-
-        # IMAGE
-        message.message_type = MessageType.IMAGE.value
-        message.save()
-        self.assertEqual(message.message_type, MessageType.IMAGE.value)
-        self.assertFalse(message.is_text)
-        self.assertTrue(message.is_image)
-        self.assertFalse(message.is_file)
-        self.assertFalse(message.is_system)
-
-        # FILE
-        message.message_type = MessageType.FILE.value
-        message.save()
-        self.assertEqual(message.message_type, MessageType.FILE.value)
-        self.assertFalse(message.is_text)
-        self.assertFalse(message.is_image)
-        self.assertTrue(message.is_file)
-        self.assertFalse(message.is_system)
-
-        # SYSTEM
-        message.message_type = MessageType.SYSTEM.value
-        message.save()
-        self.assertEqual(message.message_type, MessageType.SYSTEM.value)
-        self.assertFalse(message.is_text)
-        self.assertFalse(message.is_image)
-        self.assertFalse(message.is_file)
-        self.assertTrue(message.is_system)
-
-    def test_is_text_property(self):
-        """Testa a propriedade is_text."""
-        message = Message.objects.create(
-            room=self.chatroom,
-            sender=self.client_user,
-            content='Mensagem',
-            message_type=MessageType.TEXT.value
-        )
-        self.assertTrue(message.is_text)
-
-        message.message_type = MessageType.IMAGE.value
-        message.save()
-        self.assertFalse(message.is_text)
-
-    def test_is_image_property(self):
-        """Testa a propriedade is_image."""
-        message = Message.objects.create(
-            room=self.chatroom,
-            sender=self.client_user,
-            content='Mensagem',
-            message_type=MessageType.IMAGE.value
-        )
-        self.assertTrue(message.is_image)
-
-        message.message_type = MessageType.TEXT.value
-        message.save()
-        self.assertFalse(message.is_image)
-
-    def test_is_file_property(self):
-        """Testa a propriedade is_file."""
-        message = Message.objects.create(
-            room=self.chatroom,
-            sender=self.client_user,
-            content='Mensagem',
-            message_type=MessageType.FILE.value
-        )
-        self.assertTrue(message.is_file)
-
-        message.message_type = MessageType.TEXT.value
-        message.save()
-        self.assertFalse(message.is_file)
-
-    def test_is_system_property(self):
-        """Testa a propriedade is_system."""
-        message = Message.objects.create(
-            room=self.chatroom,
-            sender=self.client_user,
-            content='Mensagem',
-            message_type=MessageType.SYSTEM.value
-        )
-        self.assertTrue(message.is_system)
+        message = Message(room=self.chatroom, sender=self.client_user, content='Mensagem')
+        other_fields = [f.name for f in Message._meta.fields if f.name != 'message_type']
+
+        for message_type in MessageType:
+            with self.subTest(message_type=message_type):
+                message.message_type = message_type.value
+                message.clean_fields(exclude=other_fields)
+
+        message.message_type = 'invalid'
+        with self.assertRaises(ValidationError) as ctx:
+            message.clean_fields(exclude=other_fields)
+        self.assertIn('message_type', ctx.exception.message_dict)
+
+    def test_message_type_boolean_properties(self):
+        """Testa is_text/is_image/is_file/is_system para cada tipo (sem banco)."""
+        properties = {
+            MessageType.TEXT: 'is_text',
+            MessageType.IMAGE: 'is_image',
+            MessageType.FILE: 'is_file',
+            MessageType.SYSTEM: 'is_system',
+        }
+        for message_type, prop in properties.items():
+            with self.subTest(message_type=message_type):
+                message = Message(message_type=message_type.value)
+                self.assertIs(getattr(message, prop), True)
+                for other in properties.values():
+                    if other != prop:
+                        self.assertIs(getattr(message, other), False)
+
+    def test_queryset_filters_by_message_type(self):
+        """Testa os filtros por tipo do manager (text/images/files/system)."""
+        messages = {
+            message_type: Message.objects.create(
+                room=self.chatroom,
+                sender=self.client_user,
+                content=f'Mensagem {message_type}',
+                message_type=message_type
+            )
+            for message_type in MessageType
+        }
+        messages[MessageType.TEXT].delete()
 
-        message.message_type = MessageType.TEXT.value
-        message.save()
-        self.assertFalse(message.is_system)
+        self.assertFalse(Message.objects.text().exists())
+        self.assertEqual(list(Message.objects.images()), [messages[MessageType.IMAGE]])
+        self.assertEqual(list(self.chatroom.messages.files()), [messages[MessageType.FILE]])
+        self.assertEqual(list(Message.objects.all().system()), [messages[MessageType.SYSTEM]])
 
     def test_is_read_default_is_false(self):
         """Testa que is_read padrão é False."""
-        message = Message.objects.create(
+        message = Message(
             room=self.chatroom,
             sender=self.client_user,
             content='Mensagem'
@@ -725,19 +638,20 @@ class MessageModelTestCase(TestCase):
     def test_read_at_is_optional(self):
         """Testa que read_at é opcional."""
         # Mensagem sem read_at
-        message = Message.objects.create(
+        message = Message(
             room=self.chatroom,
             sender=self.client_user,
             content='Mensagem',
             is_read=False,
             read_at=None
         )
+        other_fields = [f.name for f in Message._meta.fields if f.name != 'read_at']
+        message.clean_fields(exclude=other_fields)
         self.assertIsNone(message.read_at)
 
         # Mensagem com read_at
-        read_at = timezone.now()
-        message.read_at = read_at
-        message.save()
+        message.read_at = timezone.now()
+        message.clean_fields(exclude=other_fields)
         self.assertIsNotNone(message.read_at)
 
     def test_mark_as_read_method(self):
@@ -757,7 +671,6 @@ class MessageModelTestCase(TestCase):
         before = timezone.now()
         message.mark_as_read()
         after = timezone.now()
-        message.refresh_from_db()
 
         self.assertTrue(message.is_read)
         self.assertIsNotNone(message.read_at)
@@ -777,7 +690,6 @@ class MessageModelTestCase(TestCase):
 
         # Tenta marcar como lida novamente
         message.mark_as_read()
-        message.refresh_from_db()
 
         # read_at não deve ter mudado
         self.assertEqual(message.read_at, original_read_at)
@@ -834,7 +746,7 @@ class MessageModelTestCase(TestCase):
             room=self.chatroom,
             sender=self.client_user
         )
-        with self.assertRaises(ValidationError):
+        with self.assertRaisesMessage(ValidationError, "'content'"):
             message.full_clean()
 
         # Com content, deve funcionar
@@ -848,22 +760,47 @@ class MessageModelTestCase(TestCase):
             sender=self.client_user,
             content='Mensagem de teste'
         )
-        expected = f"Mensagem #{message.id} de {self.client_user.email} em Chat #{self.chatroom.id}"
-        self.assertEqual(str(message), expected)
-
-    def test_created_at_auto_now_add(self):
-        """Testa que created_at é preenchido automaticamente."""
-        before = timezone.now()
+        message = Message.objects.get(pk=message.pk)
+        expected = f"Mensagem #{message.id} de Usuário #{self.client_user.id} em Chat #{self.chatroom.id}"
+        with self.assertNumQueries(0):
+            self.assertEqual(str(message), expected)
+
+    def test_with_sender_loads_related_in_single_query(self):
+        """Testa que with_sender carrega remetente e sala no mesmo SELECT."""
+        for i in range(3):
+            Message.objects.create(room=self.chatroom, sender=self.client_user, content=f'Mensagem {i}')
+
+        with self.assertNumQueries(1):
+            lines = [
+                (message.as_log_line(), message.room.order_id)
+                for message in Message.objects.with_sender()
+            ]
+        self.assertEqual(len(lines), 3)
+
+    def test_as_log_line_includes_sender_email(self):
+        """Testa que as_log_line inclui o e-mail do remetente."""
         message = Message.objects.create(
             room=self.chatroom,
             sender=self.client_user,
-            content='Mensagem'
+            content='Mensagem de teste'
         )
-        after = timezone.now()
+        message = Message.objects.select_related('sender').get(pk=message.pk)
+        expected = f"Mensagem #{message.id} de {self.client_user.email} em Chat #{self.chatroom.id}"
+        with self.assertNumQueries(0):
+            self.assertEqual(message.as_log_line(), expected)
 
-        self.assertIsNotNone(message.created_at)
-        self.assertGreaterEqual(message.created_at, before)
-        self.assertLessEqual(message.created_at, after)
+    def test_created_at_auto_now_add(self):
+        """Testa que created_at é preenchido automaticamente."""
+        fixed_now = timezone.now()
+        with mock.patch('django.utils.timezone.now', return_value=fixed_now):
+            message = Message.objects.create(
+                room=self.chatroom,
+                sender=self.client_user,
+                content='Mensagem'
+            )
+
+        self.assertEqual(message.created_at, fixed_now)
+        self.assertEqual(message.updated_at, fixed_now)
 
     def test_updated_at_auto_now(self):
         """Testa que updated_at é atualizado automaticamente."""
@@ -872,15 +809,15 @@ class MessageModelTestCase(TestCase):
             sender=self.client_user,
             content='Mensagem'
         )
-        original_updated_at = message.updated_at
-
-        # Aguarda um pouco para garantir diferença de tempo
-        time.sleep(0.01)
+        original_created_at = message.created_at
+        later = message.updated_at + timedelta(seconds=1)
 
         message.content = 'Mensagem Atualizada'
-        message.save()
+        with mock.patch('django.utils.timezone.now', return_value=later):
+            message.save()
 
-        self.assertGreater(message.updated_at, original_updated_at)
+        self.assertEqual(message.updated_at, later)
+        self.assertEqual(message.created_at, original_created_at)
 
     def test_soft_delete_functionality(self):
         """Testa funcionalidade de soft delete."""
@@ -919,49 +856,42 @@ class MessageModelTestCase(TestCase):
         self.assertEqual(Message.objects.count(), 1)
 
     def test_ordering_by_created_at_asc(self):
-        """Testa que ordenação padrão é por created_at ascendente."""
-        message1 = Message.objects.create(
-            room=self.chatroom,
-            sender=self.client_user,
-            content='Mensagem 1'
-        )
-
-        time.sleep(0.01)
-
-        message2 = Message.objects.create(
-            room=self.chatroom,
-            sender=self.provider_user,
-            content='Mensagem 2'
-        )
+        """Testa que chronological ordena por created_at ascendente."""
+        # Relógio fixo por mensagem em vez de esperar o tempo avançar
+        now = timezone.now()
+        with mock.patch('django.utils.timezone.now', return_value=now - timedelta(seconds=1)):
+            message1 = Message.objects.create(
+                room=self.chatroom,
+                sender=self.client_user,
+                content='Mensagem 1'
+            )
+        with mock.patch('django.utils.timezone.now', return_value=now):
+            message2 = Message.objects.create(
+                room=self.chatroom,
+                sender=self.provider_user,
+                content='Mensagem 2'
+            )
 
-        messages = list(Message.objects.all())
+        messages = list(self.chatroom.messages.chronological())
 
         # message1 é mais antiga, deve aparecer primeiro
         self.assertEqual(messages[0], message1)
         self.assertEqual(messages[1], message2)
 
-    def test_indexes_exist(self):
-        """Testa que os índices foram criados corretamente."""
-        message = Message.objects.create(
-            room=self.chatroom,
-            sender=self.client_user,
-            content='Mensagem'
-        )
-
-        # Testa queries que usam os índices (verifica que não há erros)
-        Message.objects.filter(room=self.chatroom).first()
-        Message.objects.filter(sender=self.client_user).first()
-        Message.objects.filter(created_at__gte=timezone.now() - timedelta(days=1)).first()
-        Message.objects.filter(is_read=False).first()
-        Message.objects.filter(deleted_at__isnull=True).first()
+    def test_no_default_ordering(self):
+        """Testa que consultas sem ordenação explícita não geram ORDER BY."""
+        self.assertFalse(Message.objects.all().ordered)
+        self.assertFalse(ChatRoom.objects.all().ordered)
+        self.assertTrue(Message.objects.chronological().ordered)
+        self.assertTrue(ChatRoom.objects.by_recent_activity().ordered)
 
-        # Verifica que os índices estão definidos no Meta
+    def test_indexes_exist(self):
+        """Testa que os índices estão definidos no Meta."""
         index_names = [idx.name for idx in Message._meta.indexes]
-        self.assertIn('message_room_idx', index_names)
         self.assertIn('message_sender_idx', index_names)
-        self.assertIn('message_created_at_idx', index_names)
-        self.assertIn('message_is_read_idx', index_names)
-        self.assertIn('message_deleted_at_idx', index_names)
+        self.assertIn('message_room_created_cover_idx', index_names)
+        self.assertIn('message_room_unread_idx', index_names)
+        self.assertIn('message_recipient_unread_idx', index_names)
 
     def test_cascade_delete_when_room_hard_deleted(self):
         """Testa que mensagens são deletadas quando sala é hard deleted."""
@@ -978,6 +908,34 @@ class MessageModelTestCase(TestCase):
         # A mensagem também deve ser deletada (CASCADE)
         self.assertFalse(Message.all_objects.filter(id=message_id).exists())
 
+    def test_delete_with_messages(self):
+        """Testa que delete_with_messages marca as mensagens vivas em lote."""
+        deleted_at = timezone.now() - timedelta(days=1)
+        alive = Message.objects.create(
+            room=self.chatroom,
+            sender=self.client_user,
+            content='Viva'
+        )
+        already_deleted = Message.objects.create(
+            room=self.chatroom,
+            sender=self.client_user,
+            content='Já deletada',
+            deleted_at=deleted_at
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            Message.get_unread_count(self.chatroom, self.provider_user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.chatroom.delete_with_messages()
+
+        alive.refresh_from_db()
+        already_deleted.refresh_from_db()
+        self.assertEqual(alive.deleted_at, self.chatroom.deleted_at)
+        # Mensagens já deletadas mantêm a data original
+        self.assertEqual(already_deleted.deleted_at, deleted_at)
+        self.assertFalse(Message.objects.filter(room=self.chatroom).exists())
+        self.assertEqual(Message.get_unread_count(self.chatroom, self.provider_user), 0)
+
     def test_cascade_delete_when_sender_hard_deleted(self):
         """Testa que mensagens são deletadas quando remetente é hard deleted."""
         message = Message.objects.create(
@@ -1012,32 +970,294 @@ class MessageModelTestCase(TestCase):
         self.assertIsNotNone(message.read_at)
         self.assertTrue(message.is_read)
 
-    def test_multiple_messages_in_same_room(self):
-        """Testa criação de múltiplas mensagens na mesma sala."""
-        message1 = Message.objects.create(
-            room=self.chatroom,
-            sender=self.client_user,
-            content='Mensagem 1',
-            message_type=MessageType.TEXT.value
-        )
-        message2 = Message.objects.create(
+    def test_recipient_is_filled_with_other_participant(self):
+        """Testa que o destinatário é preenchido com o outro participante da sala."""
+        from_client = Message.objects.create(room=self.chatroom, sender=self.client_user, content='Olá')
+        from_provider = Message.objects.create(room=self.chatroom, sender=self.provider_user, content='Oi')
+
+        self.assertEqual(from_client.recipient, self.provider_user)
+        self.assertEqual(from_provider.recipient, self.client_user)
+        self.assertEqual(list(Message.objects.unread_for(self.client_user)), [from_provider])
+
+    def test_read_methods_accept_shared_timestamp(self):
+        """Testa que mark_as_read/mark_room_as_read usam o timestamp informado."""
+        now = timezone.now() - timedelta(minutes=5)
+        single = Message.objects.create(room=self.chatroom, sender=self.provider_user, content='Avulsa')
+        single.mark_as_read(now=now)
+        Message.objects.create(room=self.chatroom, sender=self.provider_user, content='Em lote')
+        Message.mark_room_as_read(self.chatroom, self.client_user, now=now)
+
+        read_at_values = set(Message.objects.filter(room=self.chatroom).values_list('read_at', flat=True))
+        self.assertEqual(read_at_values, {now})
+
+    def test_bulk_send_creates_messages_and_updates_rooms(self):
+        """Testa que bulk_send cria as mensagens e atualiza a sala com poucas queries."""
+        messages = [
+            Message(room=self.chatroom, sender=self.client_user, content=f'Aviso {i}',
+                    message_type=MessageType.SYSTEM.value)
+            for i in range(10)
+        ]
+
+        # SELECT das salas + INSERT em lote + UPDATE das salas
+        # (+ SAVEPOINT/RELEASE do atomic, aninhado na transação do TestCase)
+        with self.assertNumQueries(5):
+            created = Message.bulk_send(messages)
+
+        self.assertEqual(len(created), 10)
+        self.assertEqual(Message.objects.system().filter(room=self.chatroom).count(), 10)
+        self.assertTrue(all(m.recipient_id == self.provider_user.id for m in created))
+        self.assertTrue(all(m.created_at is not None for m in created))
+        self.chatroom.refresh_from_db()
+        self.assertIsNotNone(self.chatroom.last_message_at)
+
+    def test_get_unread_count_is_served_from_cache(self):
+        """Testa que o contador de não lidas é calculado uma vez e depois lido do cache."""
+        Message.objects.create(room=self.chatroom, sender=self.provider_user, content='Mensagem 1')
+
+        with self.assertNumQueries(1), self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(Message.get_unread_count(self.chatroom, self.client_user), 1)
+        with self.assertNumQueries(0):
+            self.assertEqual(Message.get_unread_count(self.chatroom, self.client_user), 1)
+
+    def test_unread_count_cache_follows_send_and_read_events(self):
+        """Testa que envio, envio em lote e leitura invalidam o contador, recalculado uma vez."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(Message.get_unread_count(self.chatroom, self.client_user), 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Message.objects.create(room=self.chatroom, sender=self.provider_user, content='Mensagem 1')
+            Message.bulk_send([
+                Message(room=self.chatroom, sender=self.provider_user, content=f'Aviso {i}')
+                for i in range(2)
+            ])
+        with self.assertNumQueries(1), self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(Message.get_unread_count(self.chatroom, self.client_user), 3)
+        with self.assertNumQueries(0):
+            self.assertEqual(Message.get_unread_count(self.chatroom, self.client_user), 3)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Message.mark_room_as_read(self.chatroom, self.client_user)
+        with self.assertNumQueries(1):
+            self.assertEqual(Message.get_unread_count(self.chatroom, self.client_user), 0)
+
+    def test_unread_count_refill_does_not_overwrite_concurrent_write(self):
+        """Testa que um envio ou leitura entre o COUNT e a gravação não deixa contador antigo no cache."""
+        writes = [
+            ('envio', lambda: Message.objects.create(
+                room=self.chatroom, sender=self.provider_user, content='Nova'
+            ), 2),
+            ('leitura', lambda: Message.mark_room_as_read(self.chatroom, self.client_user), 0),
+        ]
+        for name, write, expected in writes:
+            with self.subTest(write=name), transaction.atomic():
+                Message.objects.create(room=self.chatroom, sender=self.provider_user, content='Mensagem')
+                cache.clear()
+
+                # Leitura concorrente: COUNT feito, gravação ainda pendente
+                with self.captureOnCommitCallbacks() as refill:
+                    self.assertEqual(Message.get_unread_count(self.chatroom, self.client_user), 1)
+                with self.captureOnCommitCallbacks(execute=True):
+                    write()
+                for callback in refill:
+                    callback()
+
+                self.assertEqual(Message.get_unread_count(self.chatroom, self.client_user), expected)
+                transaction.set_rollback(True)
+
+    def test_unread_count_cache_is_invalidated_on_message_update(self):
+        """Testa que alterar uma mensagem (ex.: marcar como lida) descarta o contador."""
+        message = Message.objects.create(room=self.chatroom, sender=self.provider_user, content='Mensagem')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(Message.get_unread_count(self.chatroom, self.client_user), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            message.mark_as_read()
+
+        self.assertEqual(Message.get_unread_count(self.chatroom, self.client_user), 0)
+
+    def test_unread_count_cache_is_invalidated_on_queryset_writes(self):
+        """Testa que UPDATE, delete, restore e hard_delete em lote descartam o contador."""
+        Message.objects.create(room=self.chatroom, sender=self.provider_user, content='Mensagem')
+        writes = [
+            ('update', lambda: Message.objects.filter(room=self.chatroom).update(is_read=True), 0),
+            ('update (all_objects)', lambda: Message.all_objects.filter(room=self.chatroom).update(is_read=False), 1),
+            ('delete', lambda: Message.objects.filter(room=self.chatroom).delete(), 0),
+            ('restore', lambda: Message.deleted_objects.filter(room=self.chatroom).restore(), 1),
+            ('hard_delete', lambda: Message.objects.filter(room=self.chatroom).hard_delete(), 0),
+        ]
+        for name, write, expected in writes:
+            with self.subTest(write=name):
+                with self.captureOnCommitCallbacks(execute=True):
+                    Message.get_unread_count(self.chatroom, self.client_user)
+                with self.captureOnCommitCallbacks(execute=True):
+                    write()
+                self.assertEqual(Message.get_unread_count(self.chatroom, self.client_user), expected)
+
+    def test_unread_count_cache_is_invalidated_on_hard_delete(self):
+        """Testa que o hard delete da mensagem ou da sala descarta o contador."""
+        for target in ('message', 'room'):
+            with self.subTest(target=target), transaction.atomic():
+                message = Message.objects.create(room=self.chatroom, sender=self.provider_user, content='Mensagem')
+                with self.captureOnCommitCallbacks(execute=True):
+                    Message.get_unread_count(self.chatroom, self.client_user)
+                with self.captureOnCommitCallbacks(execute=True):
+                    (message if target == 'message' else copy.copy(self.chatroom)).hard_delete()
+                self.assertEqual(Message.get_unread_count(self.chatroom, self.client_user), 0)
+                transaction.set_rollback(True)
+
+    def test_unread_count_cache_is_untouched_on_rollback(self):
+        """Testa que uma transação desfeita não altera o contador em cache."""
+        with self.captureOnCommitCallbacks(execute=True):
+            Message.get_unread_count(self.chatroom, self.client_user)
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks, transaction.atomic():
+            Message.objects.create(room=self.chatroom, sender=self.provider_user, content='Mensagem')
+            transaction.set_rollback(True)
+
+        self.assertEqual(callbacks, [])
+        with self.assertNumQueries(0):
+            self.assertEqual(Message.get_unread_count(self.chatroom, self.client_user), 0)
+
+    def test_bulk_send_sets_last_message_of_each_room(self):
+        """Testa que bulk_send grava a última mensagem de cada sala envolvida."""
+        other_room = ChatRoom.objects.create(
+            order=self.order,
+            client=self.provider_user,
+            provider=self.client_user
+        )
+        Message.bulk_send([
+            Message(room=self.chatroom, sender=self.client_user, content='Primeira'),
+            Message(room=other_room, sender=self.client_user, content='Outra sala',
+                    message_type=MessageType.SYSTEM.value),
+            Message(room=self.chatroom, sender=self.provider_user, content='Última'),
+        ])
+
+        self.chatroom.refresh_from_db()
+        other_room.refresh_from_db()
+        self.assertEqual(self.chatroom.last_message_preview, 'Última')
+        self.assertEqual(self.chatroom.last_message_sender, self.provider_user)
+        self.assertEqual(self.chatroom.last_message_type, MessageType.TEXT.value)
+        self.assertEqual(other_room.last_message_preview, 'Outra sala')
+        self.assertEqual(other_room.last_message_type, MessageType.SYSTEM.value)
+
+    def test_content_preview_is_filled_on_save_and_bulk_send(self):
+        """Testa que content_preview é preenchido no save (inclusive com update_fields) e no bulk_send."""
+        message = Message.objects.create(room=self.chatroom, sender=self.client_user, content='x' * 300)
+        self.assertEqual(message.content_preview, 'x' * 255)
+
+        message.content = 'Editada'
+        message.save(update_fields=['content'])
+        message.refresh_from_db()
+        self.assertEqual(message.content_preview, 'Editada')
+
+        bulk_message, = Message.bulk_send([
+            Message(room=self.chatroom, sender=self.client_user, content='y' * 300)
+        ])
+        self.assertEqual(Message.objects.get(pk=bulk_message.pk).content_preview, 'y' * 255)
+
+    def test_for_listing_does_not_load_content(self):
+        """Testa que for_listing não carrega o conteúdo completo."""
+        Message.objects.create(room=self.chatroom, sender=self.client_user, content='Mensagem')
+
+        message = Message.objects.for_listing().get()
+
+        self.assertIn('content', message.get_deferred_fields())
+        with self.assertNumQueries(0):
+            self.assertEqual(message.content_preview, 'Mensagem')
+
+        # Salvar outros campos não deve buscar o conteúdo adiado
+        with self.assertNumQueries(1):
+            message.mark_as_read()
+
+    def test_bulk_send_rejects_missing_or_deleted_room(self):
+        """Testa que bulk_send recusa mensagens de salas inexistentes ou deletadas, sem criar nenhuma."""
+        deleted_room = ChatRoom.objects.create(
+            order=self.order,
+            client=self.provider_user,
+            provider=self.client_user,
+            deleted_at=timezone.now()
+        )
+        for room_id in (999999, deleted_room.pk):
+            with self.subTest(room_id=room_id):
+                with self.assertRaisesMessage(ValueError, str(room_id)):
+                    Message.bulk_send([
+                        Message(room=self.chatroom, sender=self.client_user, content='Válida'),
+                        Message(room_id=room_id, sender=self.client_user, content='Inválida'),
+                    ])
+                self.assertFalse(Message.all_objects.exists())
+
+    def test_bulk_send_with_empty_list(self):
+        """Testa que bulk_send sem mensagens não executa queries."""
+        with self.assertNumQueries(0):
+            self.assertEqual(Message.bulk_send([]), [])
+
+    def test_mark_room_as_read_marks_only_messages_from_other_participant(self):
+        """Testa que mark_room_as_read marca apenas as mensagens recebidas."""
+        received = [
+            Message.objects.create(room=self.chatroom, sender=self.provider_user, content=f'Mensagem {i}')
+            for i in range(3)
+        ]
+        sent = Message.objects.create(room=self.chatroom, sender=self.client_user, content='Minha mensagem')
+
+        with self.assertNumQueries(1):
+            updated = Message.mark_room_as_read(self.chatroom, self.client_user)
+
+        self.assertEqual(updated, 3)
+        for message in received:
+            message.refresh_from_db()
+            self.assertTrue(message.is_read)
+            self.assertIsNotNone(message.read_at)
+        sent.refresh_from_db()
+        self.assertFalse(sent.is_read)
+        self.assertIsNone(sent.read_at)
+
+    def test_mark_room_as_read_keeps_read_at_of_already_read_messages(self):
+        """Testa que mark_room_as_read não altera mensagens já lidas."""
+        original_read_at = timezone.now() - timedelta(hours=1)
+        message = Message.objects.create(
             room=self.chatroom,
             sender=self.provider_user,
-            content='Mensagem 2',
-            message_type=MessageType.IMAGE.value
-        )
-        message3 = Message.objects.create(
-            room=self.chatroom,
-            sender=self.client_user,
-            content='Mensagem 3',
-            message_type=MessageType.FILE.value
+            content='Mensagem',
+            is_read=True,
+            read_at=original_read_at
         )
 
-        messages = self.chatroom.messages.all()
-        self.assertEqual(messages.count(), 3)
-        self.assertIn(message1, messages)
-        self.assertIn(message2, messages)
-        self.assertIn(message3, messages)
+        updated = Message.mark_room_as_read(self.chatroom, self.client_user)
+        message.refresh_from_db()
+
+        self.assertEqual(updated, 0)
+        self.assertEqual(message.read_at, original_read_at)
+
+    def test_multiple_messages_in_same_room(self):
+        """Testa criação de múltiplas mensagens na mesma sala."""
+        # Um INSERT só. bulk_create não passa pelo save(), então o
+        # destinatário é informado aqui.
+        message1, message2, message3 = Message.objects.bulk_create([
+            Message(
+                room=self.chatroom,
+                sender=self.client_user,
+                recipient=self.provider_user,
+                content='Mensagem 1',
+                message_type=MessageType.TEXT.value
+            ),
+            Message(
+                room=self.chatroom,
+                sender=self.provider_user,
+                recipient=self.client_user,
+                content='Mensagem 2',
+                message_type=MessageType.IMAGE.value
+            ),
+            Message(
+                room=self.chatroom,
+                sender=self.client_user,
+                recipient=self.provider_user,
+                content='Mensagem 3',
+                message_type=MessageType.FILE.value
+            ),
+        ])
+
+        message_ids = set(self.chatroom.messages.values_list('pk', flat=True))
+        self.assertEqual(message_ids, {message1.pk, message2.pk, message3.pk})
 
         # Verifica tipos
         self.assertTrue(message1.is_text)
@@ -5,6 +5,14 @@ Centraliza valores de tipos de dispositivo e outras constantes para reutilizaç
 from enum import Enum
 
 
+# Labels montados uma única vez no import (não a cada acesso a .label)
+_DEVICE_TYPE_LABELS = {
+    'IOS': 'iOS',
+    'ANDROID': 'Android',
+    'WEB': 'Web',
+}
+
+
 class DeviceType(str, Enum):
     """
     Tipos possíveis de dispositivo para notificações push.
@@ -21,15 +29,12 @@ class DeviceType(str, Enum):
     @property
     def label(self):
         """Retorna o label legível do tipo de dispositivo."""
-        labels = {
-            'IOS': 'iOS',
-            'ANDROID': 'Android',
-            'WEB': 'Web',
-        }
-        return labels.get(self.value, self.value)
+        return _DEVICE_TYPE_LABELS.get(self.value, self.value)
 
     @classmethod
     def choices(cls):
-        """Retorna tuplas (value, label) para uso em Django choices."""
-        return [(member.value, member.label) for member in cls]
+        """Retorna tuplas (value, label) para uso em Django choices (montadas uma única vez)."""
+        return _DEVICE_TYPE_CHOICES
+
 
+_DEVICE_TYPE_CHOICES = tuple((member.value, member.label) for member in DeviceType)
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='devicetoken',
+            name='device_token_deleted_idx',
+        ),
+        migrations.AddIndex(
+            model_name='devicetoken',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['-created_at'], name='device_token_alive_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:11
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0002_partial_alive_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='devicetoken',
+            name='device_token_token_idx',
+        ),
+        migrations.AlterField(
+            model_name='devicetoken',
+            name='token',
+            field=models.CharField(help_text='Token do dispositivo para notificações push (FCM), único entre os tokens ativos', max_length=255, verbose_name='Token'),
+        ),
+        migrations.AddConstraint(
+            model_name='devicetoken',
+            constraint=models.UniqueConstraint(condition=models.Q(('deleted_at__isnull', True), ('is_active', True)), fields=('token',), name='uniq_active_device_token'),
+        ),
+    ]
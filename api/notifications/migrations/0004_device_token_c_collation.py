@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:05
+
+import api.utils.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0003_device_token_partial_unique'),
+    ]
+
+    operations = [
+        # No PostgreSQL o ALTER TYPE reconstrói o índice de uniq_active_device_token
+        migrations.AlterField(
+            model_name='devicetoken',
+            name='token',
+            field=api.utils.fields.PostgresCollationCharField(db_collation='C', help_text='Token do dispositivo para notificações push (FCM), único entre os tokens ativos', max_length=200, verbose_name='Token'),
+        ),
+    ]
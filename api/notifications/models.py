@@ -2,8 +2,15 @@
 Models para o app notifications (tokens de dispositivo para notificações push).
 """
 from django.db import models
+from django.db.models import Q
+from api.utils.fields import PostgresCollationCharField
 from api.utils.models import SoftDeleteMixin
-from api.notifications.enums import DeviceType
+from api.notifications.enums import DeviceType, _DEVICE_TYPE_LABELS
+
+# Valores dos tipos de dispositivo resolvidos uma única vez no import
+_TYPE_IOS = DeviceType.IOS.value
+_TYPE_ANDROID = DeviceType.ANDROID.value
+_TYPE_WEB = DeviceType.WEB.value
 
 
 class DeviceToken(SoftDeleteMixin, models.Model):
@@ -20,11 +27,13 @@ class DeviceToken(SoftDeleteMixin, models.Model):
         help_text='Usuário proprietário do dispositivo'
     )
 
-    token = models.CharField(  # type: ignore
-        max_length=255,
-        unique=True,
+    # Tokens FCM são ASCII com ~160 caracteres: no PostgreSQL a coluna usa
+    # collation "C" (comparação byte a byte)
+    token = PostgresCollationCharField(  # type: ignore
+        max_length=200,
+        db_collation='C',
         verbose_name='Token',
-        help_text='Token único do dispositivo para notificações push (FCM)'
+        help_text='Token do dispositivo para notificações push (FCM), único entre os tokens ativos'
     )
 
     device_type = models.CharField(  # type: ignore
@@ -65,26 +74,35 @@ class DeviceToken(SoftDeleteMixin, models.Model):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['user'], name='device_token_user_idx'),
-            models.Index(fields=['token'], name='device_token_token_idx'),
             models.Index(fields=['device_type'], name='device_token_type_idx'),
             models.Index(fields=['is_active'], name='device_token_active_idx'),
-            models.Index(fields=['deleted_at'], name='device_token_deleted_idx'),
+            # Parcial: só as linhas vivas, que são as que o manager padrão consulta
+            models.Index(fields=['-created_at'], name='device_token_alive_idx', condition=Q(deleted_at__isnull=True)),
+        ]
+        constraints = [
+            # Só tokens ativos precisam ser únicos; o índice parcial também
+            # atende as buscas por token no envio de notificações
+            models.UniqueConstraint(
+                fields=['token'],
+                name='uniq_active_device_token',
+                condition=Q(is_active=True, deleted_at__isnull=True),
+            ),
         ]
 
     def __str__(self):
-        return f"Token #{self.id} - {self.user.email} ({self.get_device_type_display()})"  # type: ignore[attr-defined]
+        return f"Token #{self.pk} - {self.user.email} ({_DEVICE_TYPE_LABELS.get(self.device_type, self.device_type)})"
 
     @property
     def is_ios(self):
         """Retorna True se o dispositivo é iOS."""
-        return self.device_type == DeviceType.IOS.value
+        return self.device_type == _TYPE_IOS
 
     @property
     def is_android(self):
         """Retorna True se o dispositivo é Android."""
-        return self.device_type == DeviceType.ANDROID.value
+        return self.device_type == _TYPE_ANDROID
 
     @property
     def is_web(self):
         """Retorna True se o dispositivo é Web."""
-        return self.device_type == DeviceType.WEB.value
+        return self.device_type == _TYPE_WEB
@@ -1,3 +1,80 @@
+"""
+Testes unitários para o app notifications.
+"""
+from unittest import mock, skipUnless
+
 from django.test import TestCase
+from django.db import IntegrityError, connection
+from api.notifications.models import DeviceToken
+from api.notifications.enums import DeviceType
+from api.accounts.models import User
+from api.accounts.enums import UserType
+
+
+class DeviceTokenModelTestCase(TestCase):
+    """Testes unitários para o modelo DeviceToken."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Cria dados de teste."""
+        cls.user = User(
+            email='user@example.com',
+            username='user@example.com',
+            first_name='Device',
+            last_name='User',
+            user_type=UserType.CLIENT.value
+        )
+        cls.user.set_unusable_password()
+        cls.user.save()
+
+    def create_token(self, **kwargs):
+        """Cria um token para o usuário de teste."""
+        kwargs.setdefault('token', 'fcm-token')
+        kwargs.setdefault('device_type', DeviceType.ANDROID.value)
+        return DeviceToken.objects.create(user=self.user, **kwargs)
+
+    def test_active_token_is_unique(self):
+        """Testa que o mesmo token não pode estar ativo duas vezes."""
+        self.create_token()
+        with self.assertRaises(IntegrityError):
+            self.create_token()
+
+    def test_inactive_or_deleted_token_can_be_registered_again(self):
+        """Testa que tokens inativos ou removidos não bloqueiam um novo registro."""
+        self.create_token(is_active=False)
+        deleted = self.create_token()
+        deleted.delete()
+
+        token = self.create_token()
+
+        self.assertTrue(token.is_active)
+        self.assertEqual(DeviceToken.all_objects.filter(token='fcm-token').count(), 3)
+
+    def test_device_type_boolean_properties(self):
+        """Testa is_ios, is_android e is_web para cada tipo de dispositivo."""
+        for device_type in DeviceType:
+            with self.subTest(device_type=device_type):
+                token = DeviceToken(user=self.user, token='t', device_type=device_type.value)
+                self.assertEqual(
+                    (token.is_ios, token.is_android, token.is_web),
+                    (
+                        device_type is DeviceType.IOS,
+                        device_type is DeviceType.ANDROID,
+                        device_type is DeviceType.WEB,
+                    ),
+                )
+
+    @skipUnless(connection.vendor == 'sqlite', 'texto do plano é específico do SQLite')
+    def test_default_listing_uses_alive_index(self):
+        """Testa que a listagem padrão (vivos, mais recentes primeiro) usa o índice parcial."""
+        plan = DeviceToken.objects.order_by('-created_at').explain()
+        self.assertIn('device_token_alive_idx', plan)
 
-# Create your tests here.
+    def test_token_c_collation_only_on_postgresql(self):
+        """Testa que a collation "C" de token fica no campo, mas só vai para o SQL no PostgreSQL."""
+        field = DeviceToken._meta.get_field('token')
+        self.assertEqual(field.db_collation, 'C')
+        with mock.patch.object(connection, 'vendor', 'postgresql'):
+            self.assertEqual(field.db_parameters(connection)['collation'], 'C')
+        with mock.patch.object(connection, 'vendor', 'sqlite'):
+            self.assertIsNone(field.db_parameters(connection)['collation'])
@@ -5,6 +5,16 @@ Centraliza valores de status e outras constantes para reutilização.
 from enum import Enum
 
 
+# Labels montados uma única vez no import (não a cada acesso a .label)
+_ORDER_STATUS_LABELS = {
+    'PENDING': 'Pendente',
+    'ACCEPTED': 'Aceito',
+    'IN_PROGRESS': 'Em Progresso',
+    'COMPLETED': 'Completado',
+    'CANCELLED': 'Cancelado',
+}
+
+
 class OrderStatus(str, Enum):
     """
     Status possíveis para um pedido.
@@ -23,19 +33,24 @@ class OrderStatus(str, Enum):
     @property
     def label(self):
         """Retorna o label legível do status."""
-        labels = {
-            'PENDING': 'Pendente',
-            'ACCEPTED': 'Aceito',
-            'IN_PROGRESS': 'Em Progresso',
-            'COMPLETED': 'Completado',
-            'CANCELLED': 'Cancelado',
-        }
-        return labels.get(self.value, self.value)
+        return _ORDER_STATUS_LABELS.get(self.value, self.value)
 
     @classmethod
     def choices(cls):
-        """Retorna tuplas (value, label) para uso em Django choices."""
-        return [(member.value, member.label) for member in cls]
+        """Retorna tuplas (value, label) para uso em Django choices (montadas uma única vez)."""
+        return _ORDER_STATUS_CHOICES
+
+
+_ORDER_STATUS_CHOICES = tuple((member.value, member.label) for member in OrderStatus)
+
+
+# Labels montados uma única vez no import (não a cada acesso a .label)
+_PROPOSAL_STATUS_LABELS = {
+    'PENDING': 'Pendente',
+    'ACCEPTED': 'Aceita',
+    'DECLINED': 'Recusada',
+    'EXPIRED': 'Expirada',
+}
 
 
 class ProposalStatus(str, Enum):
@@ -55,16 +70,12 @@ class ProposalStatus(str, Enum):
     @property
     def label(self):
         """Retorna o label legível do status."""
-        labels = {
-            'PENDING': 'Pendente',
-            'ACCEPTED': 'Aceita',
-            'DECLINED': 'Recusada',
-            'EXPIRED': 'Expirada',
-        }
-        return labels.get(self.value, self.value)
+        return _PROPOSAL_STATUS_LABELS.get(self.value, self.value)
 
     @classmethod
     def choices(cls):
-        """Retorna tuplas (value, label) para uso em Django choices."""
-        return [(member.value, member.label) for member in cls]
+        """Retorna tuplas (value, label) para uso em Django choices (montadas uma única vez)."""
+        return _PROPOSAL_STATUS_CHOICES
+
 
+_PROPOSAL_STATUS_CHOICES = tuple((member.value, member.label) for member in ProposalStatus)
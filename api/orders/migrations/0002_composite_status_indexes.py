@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='order',
+            name='order_client_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='order',
+            name='order_status_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='proposal',
+            name='proposal_order_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='proposal',
+            name='proposal_provider_idx',
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['client', 'status'], name='order_client_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['status', '-created_at'], name='order_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='proposal',
+            index=models.Index(fields=['order', 'status'], name='proposal_order_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='proposal',
+            index=models.Index(fields=['provider', 'status', '-created_at'], name='proposal_provider_status_idx'),
+        ),
+    ]
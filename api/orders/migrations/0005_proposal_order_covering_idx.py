@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0004_proposal_status_expires_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='proposal',
+            name='proposal_order_status_idx',
+        ),
+        migrations.AddIndex(
+            model_name='proposal',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['order', 'status'], include=('price', 'estimated_days', 'expires_at'), name='proposal_order_covering_idx'),
+        ),
+    ]
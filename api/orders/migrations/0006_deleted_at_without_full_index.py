@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0005_proposal_order_covering_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='order',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, help_text='Data e hora em que o registro foi deletado. NULL significa que está ativo.', null=True, verbose_name='Data de Exclusão'),
+        ),
+        migrations.AlterField(
+            model_name='proposal',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, help_text='Data e hora em que o registro foi deletado. NULL significa que está ativo.', null=True, verbose_name='Data de Exclusão'),
+        ),
+    ]
@@ -1,10 +1,50 @@
 """
 Models para o app orders (pedidos e propostas).
 """
-from django.db import models
+from django.db import models, transaction
+from django.db.models import BooleanField, ExpressionWrapper, Q
+from django.db.models.functions import Now
 from django.utils import timezone
 from api.utils.models import SoftDeleteMixin
-from api.orders.enums import OrderStatus, ProposalStatus
+from api.utils.managers import SoftDeleteManager, SoftDeleteQuerySet
+from api.orders.enums import OrderStatus, ProposalStatus, _ORDER_STATUS_LABELS, _PROPOSAL_STATUS_LABELS
+
+# Status a partir dos quais o pedido ainda pode ser cancelado
+_CANCELLABLE_ORDER_STATUSES = frozenset({OrderStatus.PENDING.value, OrderStatus.ACCEPTED.value})
+
+
+class OrderQuerySet(SoftDeleteQuerySet):
+    """QuerySet de pedidos."""
+
+    def with_relations(self):
+        """Carrega cliente (com usuário) e serviço (com categoria) no mesmo SELECT (evita N+1)."""
+        return self.select_related('client__user', 'service__category')
+
+    def with_proposals(self):
+        """Pré-carrega as propostas em uma consulta extra (telas de detalhe)."""
+        return self.prefetch_related('proposals')
+
+    def for_listing(self):
+        """
+        Carrega apenas as colunas usadas em listagens de pedidos.
+
+        `description` (TextField, possivelmente armazenado fora da linha via
+        TOAST no PostgreSQL) fica adiado.
+        """
+        return self.only(
+            'id', 'client', 'service', 'title', 'status',
+            'budget_min', 'budget_max', 'deadline', 'created_at',
+        )
+
+
+class OrderManager(SoftDeleteManager.from_queryset(OrderQuerySet)):  # type: ignore[misc]
+    """Manager padrão de Order: exclui deletados e expõe os métodos de OrderQuerySet."""
+
+    def get_queryset(self):
+        """Retorna queryset filtrando registros deletados."""
+        return OrderQuerySet(self.model, using=self._db).filter(
+            deleted_at__isnull=True
+        )
 
 
 class Order(SoftDeleteMixin, models.Model):
@@ -106,20 +146,40 @@ class Order(SoftDeleteMixin, models.Model):
         verbose_name='Data de Atualização'
     )
 
+    objects = OrderManager()
+
     class Meta:
         verbose_name = 'Pedido'
         verbose_name_plural = 'Pedidos'
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['client'], name='order_client_idx'),
+            # Compostos: filtro + ordenação das listagens; cobrem também
+            # as buscas só por client ou só por status
+            models.Index(fields=['client', 'status'], name='order_client_status_idx'),
+            models.Index(fields=['status', '-created_at'], name='order_status_created_idx'),
             models.Index(fields=['service'], name='order_service_idx'),
-            models.Index(fields=['status'], name='order_status_idx'),
             models.Index(fields=['deadline'], name='order_deadline_idx'),
-            models.Index(fields=['deleted_at'], name='order_deleted_at_idx'),
+            # Parcial: só as linhas vivas, que são as que o manager padrão consulta
+            models.Index(fields=['-created_at'], name='order_alive_idx', condition=Q(deleted_at__isnull=True)),
         ]
 
+    def delete_with_proposals(self):
+        """
+        Soft delete do pedido e das propostas ainda vivas dele.
+
+        `delete()` não propaga (ver docs/modelos_relacionamentos.md); use este
+        método quando as propostas também devem sair. Elas são marcadas com
+        um único UPDATE (mesmo deleted_at do pedido), sem carregar nem salvar
+        cada uma.
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            Proposal.objects.filter(order=self).update(deleted_at=now)
+            self.deleted_at = now
+            self.save(update_fields=['deleted_at'])
+
     def __str__(self):
-        return f"Pedido #{self.id}: {self.title} ({self.get_status_display()})"  # type: ignore[attr-defined]
+        return f"Pedido #{self.pk}: {self.title} ({_ORDER_STATUS_LABELS.get(self.status, self.status)})"
 
     @property
     def is_pending(self):
@@ -143,7 +203,61 @@ class Order(SoftDeleteMixin, models.Model):
 
     def can_be_cancelled(self):
         """Retorna True se o pedido pode ser cancelado."""
-        return self.status in [OrderStatus.PENDING.value, OrderStatus.ACCEPTED.value]
+        return self.status in _CANCELLABLE_ORDER_STATUSES
+
+
+class ProposalQuerySet(SoftDeleteQuerySet):
+    """QuerySet de propostas."""
+
+    def with_relations(self):
+        """Carrega pedido e prestador (com usuário) no mesmo SELECT (evita N+1)."""
+        return self.select_related('order', 'provider__user')
+
+    def for_listing(self):
+        """
+        Carrega apenas as colunas usadas em listagens de propostas.
+
+        `message` (TextField, possivelmente armazenado fora da linha via
+        TOAST no PostgreSQL) fica adiado.
+        """
+        return self.only(
+            'id', 'order', 'provider', 'price', 'estimated_days',
+            'status', 'expires_at', 'created_at',
+        )
+
+    def expired(self):
+        """
+        Propostas pendentes com prazo de validade vencido (comparado com o
+        relógio do banco). Usa o índice proposal_status_expires_idx.
+        """
+        return self.filter(
+            status=ProposalStatus.PENDING.value,
+            expires_at__isnull=False,
+            expires_at__lt=Now(),
+        )
+
+    def with_expired(self):
+        """
+        Anota `expired` (mesma regra de `Proposal.is_expired`), calculado no
+        banco para checagens em lote. `is_expired` usa a anotação quando ela
+        estiver presente.
+        """
+        return self.annotate(
+            expired=ExpressionWrapper(
+                Q(expires_at__isnull=False, expires_at__lt=Now()),
+                output_field=BooleanField(),
+            )
+        )
+
+
+class ProposalManager(SoftDeleteManager.from_queryset(ProposalQuerySet)):  # type: ignore[misc]
+    """Manager padrão de Proposal: exclui deletadas e expõe os métodos de ProposalQuerySet."""
+
+    def get_queryset(self):
+        """Retorna queryset filtrando registros deletados."""
+        return ProposalQuerySet(self.model, using=self._db).filter(
+            deleted_at__isnull=True
+        )
 
 
 class Proposal(SoftDeleteMixin, models.Model):
@@ -234,20 +348,38 @@ class Proposal(SoftDeleteMixin, models.Model):
         verbose_name='Data de Atualização'
     )
 
+    objects = ProposalManager()
+
     class Meta:
         verbose_name = 'Proposta'
         verbose_name_plural = 'Propostas'
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['order'], name='proposal_order_idx'),
-            models.Index(fields=['provider'], name='proposal_provider_idx'),
+            # Propostas vivas de um pedido. As colunas da listagem vão no INCLUDE
+            # (PostgreSQL) para permitir Index Only Scan; `message` fica de fora
+            # por ser larga. A FK order_id mantém o próprio índice.
+            models.Index(
+                fields=['order', 'status'],
+                name='proposal_order_covering_idx',
+                include=['price', 'estimated_days', 'expires_at'],
+                condition=Q(deleted_at__isnull=True),
+            ),
+            # Composto: cobre também as buscas só por provider
+            models.Index(fields=['provider', 'status', '-created_at'], name='proposal_provider_status_idx'),
             models.Index(fields=['status'], name='proposal_status_idx'),
             models.Index(fields=['expires_at'], name='proposal_expires_at_idx'),
-            models.Index(fields=['deleted_at'], name='proposal_deleted_at_idx'),
+            # Varredura de propostas vencidas (ver ProposalQuerySet.expired)
+            models.Index(
+                fields=['status', 'expires_at'],
+                name='proposal_status_expires_idx',
+                condition=Q(expires_at__isnull=False, deleted_at__isnull=True),
+            ),
+            # Parcial: só as linhas vivas, que são as que o manager padrão consulta
+            models.Index(fields=['-created_at'], name='proposal_alive_idx', condition=Q(deleted_at__isnull=True)),
         ]
 
     def __str__(self):
-        return f"Proposta #{self.id} para Pedido #{self.order.id} ({self.get_status_display()})"  # type: ignore[attr-defined]
+        return f"Proposta #{self.pk} para Pedido #{self.order_id} ({_PROPOSAL_STATUS_LABELS.get(self.status, self.status)})"
 
     @property
     def is_pending(self):
@@ -261,11 +393,36 @@ class Proposal(SoftDeleteMixin, models.Model):
 
     @property
     def is_expired(self):
-        """Retorna True se a proposta expirou."""
+        """
+        Retorna True se a proposta expirou.
+
+        Se a instância veio de `Proposal.objects.with_expired()`, usa o valor
+        calculado no banco em vez de chamar timezone.now() a cada acesso.
+        """
+        expired = getattr(self, 'expired', None)
+        if expired is not None:
+            return expired
         if self.expires_at:
             return timezone.now() > self.expires_at
         return False
 
+    @classmethod
+    def expire_stale(cls):
+        """
+        Marca como EXPIRED, com um único UPDATE, as propostas pendentes com
+        prazo de validade vencido.
+
+        Use no lugar de checar `is_expired` e salvar proposta por proposta.
+        Não dispara signals de save.
+
+        Returns:
+            int: Quantidade de propostas expiradas
+        """
+        return cls.objects.expired().update(
+            status=ProposalStatus.EXPIRED.value,
+            updated_at=Now(),
+        )
+
     def can_be_accepted(self):
         """Retorna True se a proposta pode ser aceita."""
         return self.status == ProposalStatus.PENDING.value and not self.is_expired
@@ -130,6 +130,7 @@ class Payment(SoftDeleteMixin, models.Model):
             models.Index(fields=['transaction_id'], name='svc_payment_txn_id_idx'),
             models.Index(fields=['payment_date'], name='svc_payment_date_idx'),
             models.Index(fields=['deleted_at'], name='svc_payment_deleted_idx'),
+            models.Index(fields=['-created_at'], name='svc_payment_created_idx'),
         ]
 
     def __str__(self):
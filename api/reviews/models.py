@@ -94,6 +94,7 @@ class Review(SoftDeleteMixin, models.Model):
             models.Index(fields=['reviewed_user'], name='review_reviewed_user_idx'),
             models.Index(fields=['rating'], name='review_rating_idx'),
             models.Index(fields=['deleted_at'], name='review_deleted_at_idx'),
+            models.Index(fields=['-created_at'], name='review_created_at_idx'),
         ]
         # Índice único: (order, reviewer) - garante que cada usuário só pode avaliar uma vez por pedido
         constraints = [
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:59
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('subscriptions', '0002_create_initial_plans'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='usersubscription',
+            index=models.Index(fields=['-created_at'], name='subscription_created_at_idx'),
+        ),
+    ]
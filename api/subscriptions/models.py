@@ -189,6 +189,7 @@ class UserSubscription(SoftDeleteMixin, models.Model):
             models.Index(fields=['status'], name='subscription_status_idx'),
             models.Index(fields=['end_date'], name='subscription_end_date_idx'),
             models.Index(fields=['deleted_at'], name='subscription_deleted_at_idx'),
+            models.Index(fields=['-created_at'], name='subscription_created_at_idx'),
         ]
 
     def __str__(self):
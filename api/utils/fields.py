@@ -0,0 +1,21 @@
+"""
+Custom model fields.
+"""
+from django.db import models
+
+
+class PostgresCollationCharField(models.CharField):
+    """
+    CharField cuja `db_collation` só é aplicada no PostgreSQL.
+
+    A collation fica no estado das migrações (como em um CharField comum),
+    então AlterField gera o SQL com o tamanho e a collation do campo. Nos
+    demais bancos, como o SQLite dos testes (que não conhece collations como
+    "C"), a coluna usa a collation padrão.
+    """
+
+    def db_parameters(self, connection):
+        params = super().db_parameters(connection)
+        if connection.vendor != 'postgresql':
+            params['collation'] = None
+        return params
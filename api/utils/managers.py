@@ -2,6 +2,7 @@
 Custom managers for Soft Delete functionality.
 """
 from django.db import models
+from django.db.models import Count, Q
 from django.utils import timezone
 
 
@@ -28,6 +29,20 @@ class SoftDeleteQuerySet(models.QuerySet):
         """Retorna apenas registros deletados."""
         return self.filter(deleted_at__isnull=False)
 
+    def counts(self):
+        """
+        Conta registros ativos e deletados em uma única consulta.
+
+        Usa agregação condicional em vez de um COUNT por manager.
+
+        Returns:
+            dict: {'alive': int, 'deleted': int}
+        """
+        return self.aggregate(
+            alive=Count('pk', filter=Q(deleted_at__isnull=True)),
+            deleted=Count('pk', filter=Q(deleted_at__isnull=False)),
+        )
+
 
 class SoftDeleteManager(models.Manager):
     """
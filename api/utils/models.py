@@ -32,7 +32,6 @@ class SoftDeleteMixin(models.Model):
     deleted_at = models.DateTimeField(  # type: ignore
         null=True,
         blank=True,
-        db_index=True,
         verbose_name='Data de Exclusão',
         help_text='Data e hora em que o registro foi deletado. NULL significa que está ativo.'
     )
@@ -98,6 +97,19 @@ class SoftDeleteMixin(models.Model):
         self.save(update_fields=['deleted_at'])
         return True
 
+    @classmethod
+    def counts(cls):
+        """
+        Retorna o total de registros ativos e deletados do modelo.
+
+        Equivale a objects.count() e deleted_objects.count(), mas com uma
+        única consulta (agregação condicional sobre all_objects).
+
+        Returns:
+            dict: {'alive': int, 'deleted': int}
+        """
+        return cls.all_objects.all().counts()
+
     @property
     def is_deleted(self):
         """Retorna True se o registro está deletado."""
@@ -189,6 +189,15 @@ class SoftDeleteModelTestCase(TransactionTestCase):
         self.assertEqual(dead.count(), 1)
         self.assertIn(self.obj1, dead)
 
+    def test_counts_single_query(self):
+        """Testa counts(): ativos e deletados em uma única consulta."""
+        self.obj1.delete()
+
+        with self.assertNumQueries(1):
+            counts = TestModel.counts()
+
+        self.assertEqual(counts, {'alive': 2, 'deleted': 1})
+
 
 class SoftDeleteMixinTestCase(TransactionTestCase):
     """Testes para SoftDeleteMixin."""
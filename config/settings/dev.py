@@ -28,6 +28,12 @@ if 'test' in sys.argv or 'pytest' in sys.modules:
             'NAME': ':memory:',
         }
     }
+    # Índices com INCLUDE (ex.: message_room_created_cover_idx) são só do
+    # PostgreSQL; no SQLite as colunas extras são ignoradas.
+    SILENCED_SYSTEM_CHECKS = ['models.W040']
+    # Hash rápido nos testes: o bcrypt custa dezenas de ms por senha criada ou
+    # verificada. Os testes que cobrem o hash de produção usam override_settings.
+    PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
 
 # Email backend para desenvolvimento (console)
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'